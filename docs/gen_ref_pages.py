@@ -1,6 +1,11 @@
 """Generate the code reference pages and navigation."""
 
 import ast
+import functools
+import hashlib
+import os
+import sys
+import types
 from pathlib import Path
 from typing import Iterator
 
@@ -11,92 +16,202 @@ nav["Home"] = "index.md"
 
 root = Path(__file__).parent.parent
 src = root / "kalpy"
+root_str = str(root)
+src_str = str(src)
+cache_dir = root / ".mkdocs_cache" / "gen_ref"
 
+# Bump whenever the emitted markdown changes shape so stale cache entries are ignored.
+_TEMPLATE_VERSION = b"3"
+
+# `mkdocs serve` re-runs this script in a fresh namespace on every rebuild, so the
+# in-memory page cache lives on a module registered in sys.modules to outlive a run.
+_session = sys.modules.setdefault(
+    "_gen_ref_pages_session", types.ModuleType("_gen_ref_pages_session")
+)
+_RENDER_CACHE: dict[
+    str, tuple[tuple[int, int], tuple[str, str, tuple[str, ...], str]]
+] = _session.__dict__.setdefault(f"render_cache_{_TEMPLATE_VERSION.decode()}", {})
+
+_CLASS_MEMBER_TYPES = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
 
-def make_reference(
-    prefix: str, m_name: str, member_names: list[str] | None = None
-) -> str:
-    """Generate the mkdocstrings directive."""
-    options = ["    options:"]
-    if member_names is not None:
-        if member_names:
-            options.append("        members:")
-            options.extend(f"            - {m}" for m in member_names)
-        else:
-            options.append("        members: []")
-    else:
-        options.append("        members: yes")
 
-    return f"::: {prefix}.{m_name}\n" + "\n".join(options) + "\n"
+def _ref_all(prefix: str, m_name: str) -> str:
+    """Directive documenting every member of the object."""
+    return f"::: {prefix}.{m_name}\n    options:\n        members: yes\n"
 
 
-def get_class_members(node: ast.ClassDef) -> list[str]:
-    """Extract public method names from a class definition."""
-    to_return: list[str] = []
+def _ref_none(prefix: str, m_name: str) -> str:
+    """Directive documenting the object without any of its members."""
+    return f"::: {prefix}.{m_name}\n    options:\n        members: []\n"
 
-    for child in node.body:
-        if (
-            isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef))
-            and not child.name.startswith("_")
-        ):
-            to_return.append(child.name)
 
-    return to_return
+def _ref_members(prefix: str, m_name: str, member_names: list[str]) -> str:
+    """Directive documenting only the listed members of the object."""
+    return (
+        f"::: {prefix}.{m_name}\n    options:\n        members:\n"
+        + "".join([f"            - {m}\n" for m in member_names])
+    )
+
+
+def make_reference(
+    prefix: str, m_name: str, member_names: list[str] | None = None
+) -> str:
+    """Generate the mkdocstrings directive."""
+    if member_names is None:
+        return _ref_all(prefix, m_name)
+    if member_names:
+        return _ref_members(prefix, m_name, member_names)
+    return _ref_none(prefix, m_name)
 
 
-def iter_definitions(ast_tree: ast.Module) -> Iterator[tuple[str, list[str] | None]]:
-    """Yield top-level definitions (name, members) from the AST."""
+def collect_definitions(ast_tree: ast.Module) -> list[tuple[str, list[str] | None]]:
+    """Return the top-level definitions (name, members) of the AST."""
+    definitions: list[tuple[str, list[str] | None]] = []
     for node in ast_tree.body:
         if isinstance(node, ast.ClassDef):
             if not node.name.startswith("_"):
-                yield node.name, get_class_members(node)
+                members = [
+                    child.name
+                    for child in node.body
+                    if type(child) in _CLASS_MEMBER_TYPES
+                    and not child.name.startswith("_")
+                ]
+                definitions.append((node.name, members))
         elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
             if not node.name.startswith("_"):
-                yield node.name, None
+                definitions.append((node.name, None))
         elif isinstance(node, ast.Assign):
             for target in node.targets:
-                if isinstance(target, ast.Name) and not target.id.startswith("_"):
-                    yield target.id, None
+                if type(target) is ast.Name and not target.id.startswith("_"):
+                    definitions.append((target.id, None))
         elif isinstance(node, ast.AnnAssign):
             if isinstance(node.target, ast.Name) and not node.target.id.startswith("_"):
-                yield node.target.id, None
+                definitions.append((node.target.id, None))
         elif isinstance(node, ast.TypeAlias):
             if not node.name.id.startswith("_"):
-                yield node.name.id, None
+                definitions.append((node.name.id, None))
+    return definitions
+
+
+@functools.lru_cache(maxsize=None)
+def _pretty(part: str) -> str:
+    """Human-readable title for a module or package name."""
+    return part.replace("_", " ").title()
+
+
+def _is_hidden(name: str) -> bool:
+    return name.startswith(("example", "_"))
+
+
+def _walk_py(root_dir: str) -> Iterator[tuple[str, str]]:
+    """Yield (module path relative to `root_dir` without suffix, file path) per .py file.
+
+    Modules whose every path component is private or an example are left out. Whether
+    all ancestors are hidden is carried down the walk, so the check is a single prefix
+    test per file and skipped modules are never opened.
+    """
+    stack = [(root_dir, True)]
+    while stack:
+        directory, ancestors_hidden = stack.pop()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "__pycache__":
+                        stack.append(
+                            (entry.path, ancestors_hidden and _is_hidden(entry.name))
+                        )
+                elif entry.name.endswith(".py") and entry.is_file():
+                    if ancestors_hidden and _is_hidden(entry.name):
+                        continue
+                    yield os.path.relpath(entry.path, root_dir)[:-3], entry.path
+
+
+def render_module(path: str, rel_module: str, module_parts: list[str]) -> str:
+    """Render the reference page for a module, reusing the on-disk cache when possible."""
+    with open(path, "rb") as f_source:
+        source = f_source.read()
+    key = hashlib.blake2b(
+        _TEMPLATE_VERSION + b"\0" + rel_module.encode() + b"\0" + source,
+        digest_size=16,
+    ).hexdigest()
+    cache_file = cache_dir / f"{key}.md"
+    if cache_file.exists():
+        return cache_file.read_text(encoding="utf-8")
+
+    module_name = module_parts[-1]
+    package_name = ".".join(("kalpy", *module_parts[:-1]))
+    module_full_name = f"{package_name}.{module_name}"
+
+    parts = [
+        f"# {_pretty(module_name)}\n\n",
+        _ref_none(package_name, module_name),
+    ]
 
+    try:
+        # ast.parse decodes bytes itself, honouring any PEP 263 coding cookie
+        definitions = collect_definitions(ast.parse(source, filename=path))
+    except SyntaxError:
+        return "".join(parts)
 
-for path in sorted(src.rglob("*.py")):
-    module_path = path.relative_to(src).with_suffix("")
-    doc_path = path.relative_to(src).with_suffix(".md")
-    full_doc_path = Path("docs", doc_path)
+    parts.extend(
+        make_reference(module_full_name, name, members) for name, members in definitions
+    )
 
-    module_name = module_path.stem
-    if all(part.startswith(("example", "_")) for part in module_path.parts):
-        continue
+    text = "".join(parts)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+    tmp_file.write_text(text, encoding="utf-8")
+    os.replace(tmp_file, cache_file)
+    return text
 
-    formatted_name = module_name.replace("_", " ").title()
 
+def render_page(rel_module: str, path: str) -> tuple[str, str, tuple[str, ...], str]:
+    """Render one module page as (doc path, markdown, nav key, edit path)."""
+    module_parts = rel_module.split(os.sep)
     # Use the full module path for navigation to preserve hierarchy
-    nav_parts = ["API Reference"] + [
-        part.replace("_", " ").title() for part in module_path.parts
-    ]
-    nav[tuple(nav_parts)] = full_doc_path.as_posix()
+    nav_parts = ("API Reference", *map(_pretty, module_parts))
 
-    with mkdocs_gen_files.open(full_doc_path, "w") as f:
-        f.write(f"# {formatted_name}\n\n")
-        module_full_name = f"kalpy.{".".join(module_path.parts)}"
-        f.write(make_reference("kalpy", module_name, []))
+    return (
+        f"docs/{"/".join(module_parts)}.md",
+        render_module(path, rel_module, module_parts),
+        nav_parts,
+        os.path.relpath(path, root_str),
+    )
+
+
+def render_pages(
+    modules: list[tuple[str, str]],
+) -> list[tuple[str, str, tuple[str, ...], str]]:
+    """Render all module pages, reusing pages of files unchanged since the last run.
+
+    A file is considered unchanged when its mtime and size match, so a hit costs one
+    `stat` instead of a read, hash and parse.
+    """
+    pages: list[tuple[str, str, tuple[str, ...], str]] = []
 
-        try:
-            with open(path, "r", encoding="utf-8") as f_source:
-                tree = ast.parse(f_source.read())
-        except (SyntaxError, UnicodeDecodeError):
-            continue
+    for rel_module, path in modules:
+        st = os.stat(path)
+        stat_key = (st.st_mtime_ns, st.st_size)
 
-        for name, members in iter_definitions(tree):
-            f.write(make_reference(module_full_name, name, members))
+        hit = _RENDER_CACHE.get(path)
+        if hit is None or hit[0] != stat_key:
+            hit = (stat_key, render_page(rel_module, path))
+            _RENDER_CACHE[path] = hit
+        pages.append(hit[1])
+
+    return pages
+
+
+# Sort on path components (suffix included) to keep the order of a sorted rglob walk
+modules = sorted(_walk_py(src_str), key=lambda module: module[1].split(os.sep))
+
+for full_doc_path, text, nav_key, edit_path in render_pages(modules):
+    nav[nav_key] = full_doc_path
+
+    with mkdocs_gen_files.open(full_doc_path, "w") as f:
+        f.write(text)
 
-    mkdocs_gen_files.set_edit_path(full_doc_path, path.relative_to(root))
+    mkdocs_gen_files.set_edit_path(full_doc_path, edit_path)
 
 with mkdocs_gen_files.open("SUMMARY.md", "w") as nav_file:
     nav_file.writelines(nav.build_literate_nav())
@@ -0,0 +1,200 @@
+"""An HTTP/2 transport for `KaleidoscopeClient` built on httpx.
+
+`HttpxSession` exposes the small part of the `requests.Session` interface that the
+client uses, so the client's request methods work unchanged with either transport.
+httpx (with its `http2` extra) is an optional dependency and is only imported when
+this transport is selected. Its transport errors are raised as the matching
+`requests` exceptions, so callers handle failures the same way for both transports.
+"""
+
+from contextlib import contextmanager
+import time
+from typing import Any, Iterator, Optional
+
+import requests
+from urllib3.exceptions import InvalidHeader, MaxRetryError
+from urllib3.util.retry import Retry
+
+
+@contextmanager
+def _requests_errors() -> Iterator[None]:
+    """Raise httpx transport errors as the matching `requests` exceptions."""
+    import httpx
+
+    try:
+        yield
+    except httpx.ConnectTimeout as e:
+        raise requests.exceptions.ConnectTimeout(str(e)) from e
+    except httpx.ReadTimeout as e:
+        raise requests.exceptions.ReadTimeout(str(e)) from e
+    except httpx.TimeoutException as e:
+        raise requests.exceptions.Timeout(str(e)) from e
+    except httpx.ProxyError as e:
+        raise requests.exceptions.ProxyError(str(e)) from e
+    except httpx.TransportError as e:
+        raise requests.exceptions.ConnectionError(str(e)) from e
+
+
+class _HttpxRaw:
+    """File-like access to a streamed httpx response, like `requests`' `resp.raw`."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._buffer = b""
+        self.decode_content = True  # httpx always decodes the content encoding
+
+    def read(self, size: int = -1, decode_content: bool = True) -> bytes:
+        with _requests_errors():
+            return self._read(size)
+
+    def _read(self, size: int) -> bytes:
+        if size < 0:
+            data = self._buffer + b"".join(self._chunks)
+            self._buffer = b""
+            return data
+
+        while len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+class _HttpxResponse:
+    """The subset of `requests.Response` the client reads, over an httpx response."""
+
+    def __init__(self, response: Any, stream: bool):
+        self._response = response
+        self.status_code: int = response.status_code
+        self.headers = response.headers
+        self.url = str(response.url)
+        self.raw = _HttpxRaw(response.iter_bytes()) if stream else None
+
+    @property
+    def content(self) -> bytes:
+        with _requests_errors():
+            return self._response.read()
+
+    @property
+    def text(self) -> str:
+        with _requests_errors():
+            self._response.read()
+        return self._response.text
+
+    def json(self) -> Any:
+        with _requests_errors():
+            self._response.read()
+        return self._response.json()
+
+    def close(self) -> None:
+        self._response.close()
+
+
+class HttpxSession:
+    """A `requests.Session` stand-in that sends requests over HTTP/2 with httpx.
+
+    All requests share one multiplexed connection pool per host. Responses are
+    retried with the same urllib3 `Retry` policy the requests transport uses.
+    """
+
+    def __init__(
+        self, timeout: float, retries: int = 3, status_retry: Optional[Retry] = None
+    ):
+        """Create the underlying httpx client.
+
+        Args:
+            timeout (float): Default timeout for requests in seconds.
+            retries (int): Number of times a failed connection attempt is retried.
+                Defaults to 3.
+            status_retry (Optional[Retry]): Policy deciding which responses are
+                retried (by method and status), how often and with what backoff,
+                honouring Retry-After. Defaults to None, which retries no responses.
+
+        Raises:
+            ImportError: If httpx or its HTTP/2 support is not installed.
+        """
+        try:
+            import httpx
+            import h2  # noqa: F401  (httpx needs it for http2=True)
+        except ImportError as e:
+            raise ImportError(
+                "The httpx transport requires httpx with HTTP/2 support: "
+                "pip install 'httpx[http2]'"
+            ) from e
+
+        transport = httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            retries=retries,
+        )
+        self._client = httpx.Client(transport=transport, timeout=timeout)
+        self._status_retry = status_retry
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[dict] = None,
+        data: Any = None,
+        files: Optional[dict] = None,
+        headers: Optional[dict] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> _HttpxResponse:
+        # httpx takes raw bodies as content= and form fields as data=
+        content = data if isinstance(data, (bytes, str)) else None
+        request = self._client.build_request(
+            method,
+            url,
+            params=params,
+            content=content,
+            data=None if content is not None else data,
+            files=files,
+            headers=headers,
+            timeout=timeout if timeout is not None else self._client.timeout,
+        )
+        retry = self._status_retry
+        while True:
+            with _requests_errors():
+                response = self._client.send(request, stream=stream)
+            retry_after = response.headers.get("Retry-After")
+            if retry is None or not retry.is_retry(
+                method, response.status_code, retry_after is not None
+            ):
+                break
+            try:
+                retry = retry.increment(method, url)
+            except MaxRetryError:
+                break
+
+            response.close()
+            time.sleep(self._retry_delay(retry, retry_after))
+
+        return _HttpxResponse(response, stream)
+
+    @staticmethod
+    def _retry_delay(retry: Retry, retry_after: Optional[str]) -> float:
+        if retry_after is not None and retry.respect_retry_after_header:
+            try:
+                return retry.parse_retry_after(retry_after)
+            except InvalidHeader:
+                pass
+        return retry.get_backoff_time()
+
+    def get(self, url: str, **kwargs: Any) -> _HttpxResponse:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> _HttpxResponse:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> _HttpxResponse:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> _HttpxResponse:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self._client.close()
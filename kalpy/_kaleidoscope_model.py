@@ -17,10 +17,56 @@ Classes:
     _KaleidoscopeBaseModel: Base class for all Kaleidoscope model objects.
 """
 
+from datetime import date, time, timedelta
+from decimal import Decimal
+from enum import Enum
 from pydantic import BaseModel
 from kalpy.client import KaleidoscopeClient
+from typing import Any, Literal, Self, TypeAliasType, get_args, get_origin
+from uuid import UUID
 import json
 
+# Field types that can never contain a Kaleidoscope model
+_LEAF_TYPES = (
+    str,
+    bytes,
+    int,
+    float,
+    complex,
+    date,
+    time,
+    timedelta,
+    Decimal,
+    UUID,
+    Enum,
+)
+
+_client_fields_cache: dict[type, tuple[str, ...]] = {}
+
+
+def _may_hold_model(annotation: Any) -> bool:
+    """Whether a field annotation may hold a `_KaleidoscopeBaseModel` value.
+
+    Unknown or unresolved annotations (e.g. `Any` or forward references) are
+    conservatively treated as possibly holding a model.
+    """
+    if annotation is None or annotation is type(None):
+        return False
+    if isinstance(annotation, TypeAliasType):
+        return _may_hold_model(annotation.__value__)
+
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return False
+    if origin is not None:
+        return any(_may_hold_model(arg) for arg in get_args(annotation))
+
+    if isinstance(annotation, type):
+        return issubclass(annotation, _KaleidoscopeBaseModel) or not issubclass(
+            annotation, _LEAF_TYPES
+        )
+    return True
+
 
 class _KaleidoscopeBaseModel(BaseModel):
     """
@@ -38,6 +84,7 @@ class _KaleidoscopeBaseModel(BaseModel):
         to_json(): Serialize the model instance to a JSON string.
         to_dict(): Convert the model instance to a dictionary containing the id.
         _set_client(client): Set the KaleidoscopeClient instance for this object.
+        _from_trusted(data): Build an instance from trusted API data without validation.
     """
 
     id: str
@@ -82,6 +129,15 @@ class _KaleidoscopeBaseModel(BaseModel):
 
         return self.model_dump()
 
+    @classmethod
+    def _from_trusted(cls, data: dict) -> Self:
+        """
+        Build an instance from trusted API data without validating it.
+        Subclasses with nested models or non-string fields override this to
+        construct or convert those fields themselves.
+        """
+        return cls.model_construct(**data)
+
     def _set_client(self, client: KaleidoscopeClient) -> None:
         """
         Set the `KaleidoscopeClient` instance for this object.
@@ -89,8 +145,18 @@ class _KaleidoscopeBaseModel(BaseModel):
         """
         self._client = client
 
-        # Iterate through field names and get actual values from the instance
-        for field_name in self.__class__.model_fields.keys():
+        cls = self.__class__
+        client_fields = _client_fields_cache.get(cls)
+        if client_fields is None:
+            client_fields = tuple(
+                name
+                for name, field in cls.model_fields.items()
+                if _may_hold_model(field.annotation)
+            )
+            _client_fields_cache[cls] = client_fields
+
+        # Only fields whose type can contain models need to be walked
+        for field_name in client_fields:
             value = getattr(self, field_name, None)
             if value is None:
                 continue
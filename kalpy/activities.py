@@ -51,17 +51,20 @@ Note:
 
 from __future__ import annotations
 import logging
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-from functools import cached_property, lru_cache
+from functools import cached_property
 from kalpy._kaleidoscope_model import _KaleidoscopeBaseModel
 from kalpy.client import KaleidoscopeClient
 from kalpy.entity_fields import DataFieldTypeEnum
 from kalpy.programs import Program
 from kalpy.labels import Label
 from kalpy.workspace import WorkspaceUser, WorkspaceGroup
-from pydantic import TypeAdapter
-from typing import Any, BinaryIO, List, Literal, Optional, Union
+from pydantic import AfterValidator, ConfigDict, TypeAdapter
+from typing import Annotated, Any, BinaryIO, List, Literal, Optional, Union
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -70,6 +73,8 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+_PREFETCH_WORKERS = 8
+
 
 class ActivityStatusEnum(str, Enum):
     """Enumeration of possible activity status values.
@@ -170,6 +175,11 @@ into display-friendly strings for UI and reporting purposes.
 """
 
 
+# Strings repeated across many small objects (field ids, user ids, names) are
+# interned on validation so every instance shares a single copy.
+type _InternedStr = Annotated[str, AfterValidator(sys.intern)]
+
+
 class Property(_KaleidoscopeBaseModel):
     """Represents a property in the Kaleidoscope system.
 
@@ -189,12 +199,14 @@ class Property(_KaleidoscopeBaseModel):
         field_type (DataFieldTypeEnum): The data type of this property's content.
     """
 
-    property_field_id: str
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
+    property_field_id: _InternedStr
     content: Any
     created_at: datetime
-    last_updated_by: str
-    created_by: str
-    property_name: str
+    last_updated_by: _InternedStr
+    created_by: _InternedStr
+    property_name: _InternedStr
     field_type: DataFieldTypeEnum
 
     def __str__(self):
@@ -208,12 +220,11 @@ class Property(_KaleidoscopeBaseModel):
         """
         try:
             resp = self._client._put(
-                "/properties/" + self.id, {"content": property_value}
+                f"/properties/{self.id}", {"content": property_value}
             )
             if resp:
-                for key, value in resp.items():
-                    if hasattr(self, key):
-                        setattr(self, key, value)
+                for key in resp.keys() & _PROPERTY_FIELDS:
+                    setattr(self, key, resp[key])
         except Exception as e:
             _logger.error(f"Error updating property {self.id}: {e}")
             return None
@@ -237,7 +248,7 @@ class Property(_KaleidoscopeBaseModel):
         """
         try:
             resp = self._client._post_file(
-                "/properties/" + self.id + "/file",
+                f"/properties/{self.id}/file",
                 (file_name, file_data, file_type),
             )
             if resp is None or len(resp) == 0:
@@ -270,6 +281,8 @@ class ActivityDefinition(_KaleidoscopeBaseModel):
         external_id (Optional[str]): The id of the activity definition if it was imported from an external source
     """
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     program_ids: List[str]
     title: str
     activity_type: ActivityType
@@ -333,6 +346,8 @@ class Activity(_KaleidoscopeBaseModel):
         record_ids (List[str]): List of record IDs linked to this activity.
     """
 
+    model_config = ConfigDict(defer_build=True, extra="ignore")
+
     created_at: datetime
     parent_id: Optional[str] = None
     child_ids: List[str]
@@ -434,12 +449,7 @@ class Activity(_KaleidoscopeBaseModel):
         Note:
             This is a cached property.
         """
-        try:
-            resp = self._client._get("/activities/" + self.id + "/activities")
-            return self._client.activities._create_activity_list(resp)
-        except Exception as e:
-            _logger.error(f"Error fetching child activities: {e}")
-            return []
+        return self._fetch_child_activities()
 
     @cached_property
     def records(self) -> List["Record"]:
@@ -451,23 +461,63 @@ class Activity(_KaleidoscopeBaseModel):
         Note:
             This is a cached property.
         """
+        return self._fetch_records()
+
+    def _fetch_child_activities(self) -> List["Activity"]:
+        try:
+            resp = self._client._get_memo(f"/activities/{self.id}/activities")
+            return self._client.activities._create_activity_list(resp)
+        except Exception as e:
+            _logger.error(f"Error fetching child activities: {e}")
+            return []
+
+    def _fetch_records(self) -> List["Record"]:
         try:
-            resp = self._client._get("/operations/" + self.id + "/records")
+            resp = self._client._get_memo(f"/operations/{self.id}/records")
             return self._client.records._create_record_list(resp)
         except Exception as e:
             _logger.error(f"Error fetching records: {e}")
             return []
 
-    def get_record(self, identifier: str) -> bool:
+    def prefetch_children_and_records(self) -> None:
+        """Load the child activities and records of this activity concurrently.
+
+        Both requests are issued at the same time and their results are assigned to
+        the `child_activities` and `records` cached properties, so a tree traversal
+        waits for one round-trip per activity instead of two. Properties that are
+        already cached are not fetched again. Both requests share the
+        `request_scope` of the calling thread.
+        """
+        if "child_activities" in self.__dict__ or "records" in self.__dict__:
+            for attr, fetch in (
+                ("child_activities", self._fetch_child_activities),
+                ("records", self._fetch_records),
+            ):
+                if attr not in self.__dict__:
+                    self.__dict__[attr] = fetch()
+            return
+
+        # the records are fetched on the shared pool while this thread fetches the
+        # child activities
+        records = self._client.activities._prefetch_executor.submit(
+            self._client._in_request_scope(self._fetch_records)
+        )
+        # primes the cached_properties of the same name
+        self.__dict__["child_activities"] = self._fetch_child_activities()
+        self.__dict__["records"] = records.result()
+
+    @cached_property
+    def _records_by_identifier(self) -> dict[str, "Record"]:
+        # reversed so the first record with a given identifier wins, as in a scan
+        return {r.record_identifier: r for r in reversed(self.records)}
+
+    def get_record(self, identifier: str) -> "Record" | None:
         """Retrieves the record with the given identifier if it is in the operation
 
         Returns:
             (Record or None): The record if it is in the operation, otherwise None
         """
-        return next(
-            (r for r in self.records if r.record_identifier == identifier),
-            None,
-        )
+        return self._records_by_identifier.get(identifier)
 
     def has_record(self, identifier: str) -> bool:
         """Retrieve whether a record with the given identifier is in the operation
@@ -475,7 +525,7 @@ class Activity(_KaleidoscopeBaseModel):
         Returns:
             bool: Whether the record is in the operation
         """
-        return self.get_record(identifier) != None
+        return identifier in self._records_by_identifier
 
     def update(self, **kwargs: Any) -> None:
         """Update the activity with the provided keyword arguments.
@@ -485,11 +535,10 @@ class Activity(_KaleidoscopeBaseModel):
                 for the activity.
         """
         try:
-            resp = self._client._put("/activities/" + self.id, kwargs)
+            resp = self._client._put(f"/activities/{self.id}", kwargs)
             if resp:
-                for key, value in resp.items():
-                    if hasattr(self, key):
-                        setattr(self, key, value)
+                for key in resp.keys() & _ACTIVITY_FIELDS:
+                    setattr(self, key, resp[key])
         except Exception as e:
             _logger.error(f"Error updating activity: {e}")
             return None
@@ -502,7 +551,7 @@ class Activity(_KaleidoscopeBaseModel):
         """
         try:
             self._client._put(
-                "/operations/" + self.id + "/records", {"record_ids": record_ids}
+                f"/operations/{self.id}/records", {"record_ids": record_ids}
             )
         except Exception as e:
             _logger.error(f"Error adding record: {e}")
@@ -515,10 +564,20 @@ class Activity(_KaleidoscopeBaseModel):
             List[dict]: A list containing the activity data for each record,
                 obtained by calling get_activity_data with the current activity's ID.
         """
-        data = []
-        for record in self.records:
-            data.append(record.get_activity_data(self.id))
-        return data
+        # records are fetched in a single request; get_activity_data is local work
+        activity_id = self.id
+        return [record.get_activity_data(activity_id) for record in self.records]
+
+
+# Response keys that `update`/`update_property` copy onto the model
+_PROPERTY_FIELDS = frozenset(Property.model_fields)
+_ACTIVITY_FIELDS = frozenset(Activity.model_fields)
+
+# Validators are built on first use rather than at import, matching the models
+_ACTIVITY_LIST_ADAPTER = TypeAdapter(List[Activity], config=ConfigDict(defer_build=True))
+_ACTIVITY_DEF_LIST_ADAPTER = TypeAdapter(
+    List[ActivityDefinition], config=ConfigDict(defer_build=True)
+)
 
 
 class ActivitiesService:
@@ -530,11 +589,47 @@ class ActivitiesService:
     ID or associated records, and batch operations.
 
     Note:
-        Some methods use LRU caching to improve performance. Cache is cleared on errors.
+        `get_activities` and `get_definitions` cache their results on the service
+        instance, optionally for a limited time (see `cache_ttl`). Cache is cleared on
+        errors, and can be cleared explicitly with `clear_cache`.
     """
 
-    def __init__(self, client: KaleidoscopeClient):
+    def __init__(self, client: KaleidoscopeClient, cache_ttl: Optional[float] = None):
+        """Initialize the activities service.
+
+        Args:
+            client (KaleidoscopeClient): The client used to make API requests.
+            cache_ttl (Optional[float]): Number of seconds cached activities and
+                activity definitions stay valid. Defaults to None, meaning they are
+                kept until `clear_cache` is called.
+        """
         self._client = client
+        self._cache_ttl = cache_ttl
+        # shared by the prefetches of all activities, so a traversal does not start
+        # a pool per activity
+        self._prefetch_executor = ThreadPoolExecutor(
+            max_workers=_PREFETCH_WORKERS, thread_name_prefix="kalpy-prefetch"
+        )
+        self._activities_cache: dict[bool, tuple[float, List[Activity]]] = {}
+        self._definitions_cache: Optional[tuple[float, List[ActivityDefinition]]] = (
+            None
+        )
+        self._definition_indices_cache: Optional[
+            tuple[List[ActivityDefinition], tuple[dict, dict, dict]]
+        ] = None
+        self._activity_external_id_cache: Optional[
+            tuple[List[Activity], dict[Optional[str], Activity]]
+        ] = None
+
+    def _is_fresh(self, cached_at: float) -> bool:
+        return self._cache_ttl is None or time.monotonic() - cached_at < self._cache_ttl
+
+    def clear_cache(self) -> None:
+        """Discard the cached activities and activity definitions."""
+        self._activities_cache.clear()
+        self._definitions_cache = None
+        self._definition_indices_cache = None
+        self._activity_external_id_cache = None
 
     def _create_activity(self, data: dict) -> Activity:
         """Convert a dictionary of activity data into a validated Activity object.
@@ -554,11 +649,39 @@ class ActivitiesService:
 
         return activity
 
-    def _create_activity_list(self, data: list[dict]) -> List[Activity]:
+    def _construct_activity(self, data: dict) -> Activity:
+        """Build an Activity from trusted server data without validating it.
+
+        Nested properties are constructed as Property objects so the client can be
+        set on them, but no field is coerced: timestamps stay ISO strings and the
+        status stays a plain string.
+
+        Args:
+            data (dict): A dictionary containing the activity information, as
+                returned by the API.
+
+        Returns:
+            Activity: An activity object created from the provided data, with the
+                client set.
+        """
+        fields = dict(data)
+        fields["properties"] = [
+            Property.model_construct(**prop) for prop in data.get("properties", [])
+        ]
+        activity = Activity.model_construct(**fields)
+        activity._set_client(self._client)
+
+        return activity
+
+    def _create_activity_list(
+        self, data: list[dict], validate: bool = True
+    ) -> List[Activity]:
         """Convert input data into a list of Activity objects.
 
         Args:
             data (list[dict]): The input data to be converted into Activity objects.
+            validate (bool): Whether to validate the data. Pass False only for
+                trusted API responses; see `_construct_activity`. Defaults to True.
 
         Returns:
             List[Activity]: A list of Activity objects with clients set.
@@ -567,9 +690,13 @@ class ActivitiesService:
             ValidationError: If the data could not be validated as a list of
                 Activity objects.
         """
-        activities = TypeAdapter(List[Activity]).validate_python(data)
+        if not validate:
+            return [self._construct_activity(d) for d in data]
+
+        activities = _ACTIVITY_LIST_ADAPTER.validate_python(data)
+        client = self._client
         for activity in activities:
-            activity._set_client(self._client)
+            activity._set_client(client)
 
         return activities
 
@@ -577,9 +704,9 @@ class ActivitiesService:
         self,
         title: str,
         activity_type: ActivityType,
-        program_ids: Optional[list[str]] = [],
+        program_ids: Optional[list[str]] = None,
         activity_definition_id: Optional[str] = None,
-        assigned_user_ids: Optional[List[str]] = [],
+        assigned_user_ids: Optional[List[str]] = None,
         start_date: Optional[datetime] = None,
         duration: Optional[int] = None,
     ) -> Activity | None:
@@ -604,12 +731,12 @@ class ActivitiesService:
         try:
             start_date_formatted = start_date.isoformat() if start_date else None
             payload = {
-                "program_ids": program_ids,
+                "program_ids": program_ids or [],
                 "title": title,
                 "activity_type": activity_type,
                 "definition_id": activity_definition_id,
                 "record_ids": [],
-                "assigned_user_ids": assigned_user_ids,
+                "assigned_user_ids": assigned_user_ids or [],
                 "start_date": start_date_formatted,
                 "duration": duration,
             }
@@ -619,10 +746,15 @@ class ActivitiesService:
             _logger.error(f"Error creating activity {title}: {e}")
             return None
 
-    @lru_cache
-    def get_activities(self) -> List[Activity]:
+    def get_activities(self, validate: bool = True) -> List[Activity]:
         """Retrieve all activities in the workspace, including experiments.
 
+        Args:
+            validate (bool): Whether to validate the response. Passing False skips
+                Pydantic validation, which is considerably faster for large
+                workspaces, but leaves fields uncoerced (e.g. timestamps as ISO
+                strings). Defaults to True.
+
         Returns:
             List[Activity]: A list of Activity objects representing the activities
                 in the workspace.
@@ -631,14 +763,55 @@ class ActivitiesService:
             This method caches its results. If an exception occurs, logs the error,
             clears the cache, and returns an empty list.
         """
+        cached = self._activities_cache.get(validate)
+        if cached is not None and self._is_fresh(cached[0]):
+            return cached[1]
+
         try:
             resp = self._client._get("/activities")
-            return self._create_activity_list(resp)
+            activities = self._create_activity_list(resp, validate=validate)
         except Exception as e:
             _logger.error(f"Error fetching activities: {e}")
-            self.get_activities.cache_clear()
+            self._activities_cache.pop(validate, None)
             return []
 
+        self._activities_cache[validate] = (time.monotonic(), activities)
+        return activities
+
+    def prefetch_relations(self, activities: List[Activity]) -> None:
+        """Load the users, groups, labels and programs of many activities at once.
+
+        Each related collection is fetched once and indexed by id, then assigned to
+        the `assigned_users`, `assigned_groups`, `labels` and `programs` cached
+        properties of every activity. Accessing those properties afterwards makes no
+        further requests, and returns the same objects in the same order as the
+        individual lookups would.
+
+        Args:
+            activities (List[Activity]): The activities whose relations to load.
+        """
+        relations = (
+            ("assigned_users", "assigned_user_ids", self._client.workspace.get_members),
+            (
+                "assigned_groups",
+                "assigned_group_ids",
+                self._client.workspace.get_groups,
+            ),
+            ("labels", "label_ids", self._client.labels.get_labels),
+            ("programs", "program_ids", self._client.programs.get_programs),
+        )
+
+        for attr, ids_attr, get_all in relations:
+            positions = {item.id: (i, item) for i, item in enumerate(get_all())}
+            for activity in activities:
+                found = sorted(
+                    positions[item_id]
+                    for item_id in set(getattr(activity, ids_attr))
+                    if item_id in positions
+                )
+                # primes the cached_property of the same name
+                activity.__dict__[attr] = [item for _, item in found]
+
     def get_activity_by_id(self, activity_id: str) -> Activity | None:
         """Retrieve an activity by its unique identifier.
 
@@ -649,7 +822,7 @@ class ActivitiesService:
             (Activity or None): The Activity object if found, otherwise None.
         """
         try:
-            resp = self._client._get("/activities/" + activity_id)
+            resp = self._client._get(f"/activities/{activity_id}")
             if resp is None:
                 return None
 
@@ -667,43 +840,83 @@ class ActivitiesService:
         Returns:
             (Activity or None): The Activity object if found, otherwise None.
         """
-        activities = self.get_definitions()
-        return next(
-            (a for a in activities if a.external_id == external_id),
-            None,
-        )
+        return self._activities_by_external_id().get(external_id)
+
+    def _activities_by_external_id(self) -> dict[Optional[str], Activity]:
+        """Index the activities by external id.
+
+        The index is reused for as long as `get_activities` returns the same cached
+        list. The first activity wins on duplicate external ids.
+        """
+        activities = self.get_activities()
+        cached = self._activity_external_id_cache
+        if cached is not None and cached[0] is activities:
+            return cached[1]
+
+        by_external_id: dict[Optional[str], Activity] = {}
+        for activity in activities:
+            by_external_id.setdefault(activity.external_id, activity)
+
+        self._activity_external_id_cache = (activities, by_external_id)
+        return by_external_id
 
     def get_activities_by_ids(
-        self, ids: List[str], batch_size: int = 250
+        self,
+        ids: List[str],
+        batch_size: int = 250,
+        max_concurrency: int = 8,
+        validate: bool = True,
     ) -> List[Activity]:
         """Fetch activities by their IDs in batches.
 
+        Batches are requested concurrently, so fetching many IDs costs roughly one
+        round-trip rather than one per batch.
+
         Args:
             ids (List[str]): A list of activity ID strings to fetch.
             batch_size (int): The number of IDs to include in each batch request.
                 Defaults to 250.
+            max_concurrency (int): The maximum number of batch requests in flight at
+                once. Defaults to 8.
+            validate (bool): Whether to validate the responses. See
+                `get_activities`. Defaults to True.
 
         Returns:
-            List[Activity]: A list of Activity objects corresponding to the provided IDs.
+            List[Activity]: A list of Activity objects corresponding to the provided IDs,
+                in the order of the batches requested.
 
         Note:
             If an exception occurs, logs the error and returns an empty list.
         """
         try:
-            all_activities = []
+            # the client URL-encodes the query, so ids need no escaping here
+            batch_params = [
+                {"activity_ids": ",".join(ids[i : i + batch_size])}
+                for i in range(0, len(ids), batch_size)
+            ]
+
+            def get_batch(params: dict[str, str]) -> Any:
+                return self._client._get("/activities", params)
+
+            if len(batch_params) > 1 and max_concurrency > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_concurrency, len(batch_params))
+                ) as executor:
+                    responses = list(executor.map(get_batch, batch_params))
+            else:
+                responses = [get_batch(params) for params in batch_params]
 
-            for i in range(0, len(ids), batch_size):
-                batch = ids[i : i + batch_size]
-                resp = self._client._get(f"/activities?activity_ids={",".join(batch)}")
-                activities = self._create_activity_list(resp)
-                all_activities.extend(activities)
+            all_activities = []
+            for resp in responses:
+                all_activities.extend(
+                    self._create_activity_list(resp, validate=validate)
+                )
 
             return all_activities
         except Exception as e:
             _logger.error(f"Error fetching activities: {e}")
             return []
 
-    @lru_cache
     def get_definitions(self) -> List[ActivityDefinition]:
         """Retrieve all available activity definitions.
 
@@ -717,14 +930,51 @@ class ActivitiesService:
             This method caches its results. If an exception occurs, logs the error,
             clears the cache, and returns an empty list.
         """
+        if self._definitions_cache is not None and self._is_fresh(
+            self._definitions_cache[0]
+        ):
+            return self._definitions_cache[1]
+
         try:
             resp = self._client._get("/activity_definitions")
-            return TypeAdapter(List[ActivityDefinition]).validate_python(resp)
+            definitions = _ACTIVITY_DEF_LIST_ADAPTER.validate_python(resp)
         except Exception as e:
             _logger.error(f"Error fetching activity definitions: {e}")
-            self.get_definitions.cache_clear()
+            self._definitions_cache = None
             return []
 
+        self._definitions_cache = (time.monotonic(), definitions)
+        return definitions
+
+    def _definition_indices(
+        self,
+    ) -> tuple[
+        dict[str, ActivityDefinition],
+        dict[str, ActivityDefinition],
+        dict[Optional[str], ActivityDefinition],
+    ]:
+        """Index the activity definitions by id, title and external id.
+
+        The indices are built in one pass and reused for as long as `get_definitions`
+        returns the same cached list. The first definition wins on duplicate keys.
+        """
+        definitions = self.get_definitions()
+        cached = self._definition_indices_cache
+        if cached is not None and cached[0] is definitions:
+            return cached[1]
+
+        by_id: dict[str, ActivityDefinition] = {}
+        by_title: dict[str, ActivityDefinition] = {}
+        by_external_id: dict[Optional[str], ActivityDefinition] = {}
+        for definition in definitions:
+            by_id.setdefault(definition.id, definition)
+            by_title.setdefault(definition.title, definition)
+            by_external_id.setdefault(definition.external_id, definition)
+
+        indices = (by_id, by_title, by_external_id)
+        self._definition_indices_cache = (definitions, indices)
+        return indices
+
     def get_definition_by_name(self, name: str) -> ActivityDefinition | None:
         """Retrieve an activity definition by name.
 
@@ -734,11 +984,7 @@ class ActivitiesService:
         Returns:
             (ActivityDefinition or None): The activity definition if found, None otherwise.
         """
-        definitions = self.get_definitions()
-        return next(
-            (d for d in definitions if d.title == name),
-            None,
-        )
+        return self._definition_indices()[1].get(name)
 
     def get_definition_by_id(self, definition_id: str) -> ActivityDefinition | None:
         """Retrieve an activity definition by ID.
@@ -749,11 +995,7 @@ class ActivitiesService:
         Returns:
             (ActivityDefinition or None): The activity definition if found, None otherwise.
         """
-        definitions = self.get_definitions()
-        return next(
-            (d for d in definitions if d.id == definition_id),
-            None,
-        )
+        return self._definition_indices()[0].get(definition_id)
 
     def get_activity_definition_by_external_id(
         self, external_id: str
@@ -766,11 +1008,7 @@ class ActivitiesService:
         Returns:
             (ActivityDefinition or None): The ActivityDefinition object if found, otherwise None.
         """
-        definitions = self.get_definitions()
-        return next(
-            (d for d in definitions if d.external_id == external_id),
-            None,
-        )
+        return self._definition_indices()[2].get(external_id)
 
     def get_activities_with_record(self, record_id: str) -> List[Activity]:
         """Retrieve all activities that contain a specific record.
@@ -785,7 +1023,7 @@ class ActivitiesService:
             If an exception occurs, logs the error and returns an empty list.
         """
         try:
-            resp = self._client._get("/records/" + record_id + "/operations")
+            resp = self._client._get(f"/records/{record_id}/operations")
             return self._create_activity_list(resp)
         except Exception as e:
             _logger.error(f"Error fetching activity with record {record_id}: {e}")
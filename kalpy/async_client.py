@@ -0,0 +1,129 @@
+"""Asynchronous access to the Kaleidoscope API.
+
+This module provides `AsyncKaleidoscopeClient`, which lets many independent API
+calls be awaited concurrently, for instance with `asyncio.gather`. Requests are run
+on worker threads through the connection pool of a `KaleidoscopeClient`, so no
+additional HTTP library is required and authentication is shared with the
+synchronous client.
+
+Classes:
+    AsyncKaleidoscopeClient: An awaitable wrapper around a KaleidoscopeClient.
+
+Example:
+    ```python
+    import asyncio
+
+    async def main():
+        client = KaleidoscopeClient(client_id, client_secret)
+        async with AsyncKaleidoscopeClient(client, owns_client=True) as aclient:
+            fields = await asyncio.gather(
+                *(
+                    aclient.get_or_create_data_field(name, field_type)
+                    for name, field_type in specs
+                )
+            )
+
+    asyncio.run(main())
+    ```
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from kalpy.client import KaleidoscopeClient
+from kalpy.entity_fields import DataFieldTypeEnum, EntityField
+from typing import Any, Callable
+
+
+class AsyncKaleidoscopeClient:
+    """An awaitable wrapper around a `KaleidoscopeClient`.
+
+    Each call runs the matching synchronous method on one of `max_concurrency`
+    worker threads owned by this client, so at most that many calls are in flight
+    at once. The default matches the size of the client's connection pool, so
+    concurrent calls reuse pooled connections.
+
+    Attributes:
+        client (KaleidoscopeClient): The synchronous client the calls are made with.
+        owns_client (bool): Whether closing this client also closes `client`.
+    """
+
+    def __init__(
+        self,
+        client: KaleidoscopeClient,
+        max_concurrency: int = 20,
+        owns_client: bool = False,
+    ):
+        """Initialize the asynchronous client.
+
+        Args:
+            client (KaleidoscopeClient): The client to make the calls with.
+            max_concurrency (int): Maximum number of calls in flight at once.
+                Defaults to 20.
+            owns_client (bool): Whether `close` also closes `client`. Defaults to
+                False, leaving a client the caller still uses open.
+        """
+        self.client = client
+        self.owns_client = owns_client
+        # asyncio's default executor may have fewer workers than max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix="kalpy-async"
+        )
+
+    async def __aenter__(self) -> "AsyncKaleidoscopeClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stop the worker threads, and close the underlying client if it is owned."""
+        if self.owns_client:
+            await self.run(self.client.close)
+        self._executor.shutdown(wait=False)
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Await any blocking client or service method.
+
+        Args:
+            func (Callable[..., Any]): The method to call, such as
+                `client.records.get_record_by_id`.
+            *args: Positional arguments for `func`.
+            **kwargs: Keyword arguments for `func`.
+
+        Returns:
+            Any: The value returned by `func`.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(func, *args, **kwargs)
+        )
+
+    async def get_or_create_key_field(self, field_name: str) -> EntityField | None:
+        """Await `EntityFieldsService.get_or_create_key_field`.
+
+        Args:
+            field_name (str): The name of the key field to retrieve or create.
+
+        Returns:
+            (EntityField | None): The key field, or None if an error occurs.
+        """
+        return await self.run(
+            self.client.entity_fields.get_or_create_key_field, field_name
+        )
+
+    async def get_or_create_data_field(
+        self, field_name: str, field_type: DataFieldTypeEnum
+    ) -> EntityField | None:
+        """Await `EntityFieldsService.get_or_create_data_field`.
+
+        Args:
+            field_name (str): The name of the data field to create or retrieve.
+            field_type (DataFieldTypeEnum): The type of the data field.
+
+        Returns:
+            (EntityField | None): The data field, or None if an error occurs.
+        """
+        return await self.run(
+            self.client.entity_fields.get_or_create_data_field, field_name, field_type
+        )
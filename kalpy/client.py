@@ -17,7 +17,7 @@ The KaleidoscopeClient provides access to various service endpoints including:
 
 Attributes:
     PROD_API_URL (str): The production URL for the Kaleidoscope API.
-    VALID_CONTENT_TYPES (list): List of acceptable content types for file downloads.
+    VALID_CONTENT_TYPES (frozenset): Set of acceptable content types for file downloads.
     TIMEOUT_MAXIMUM (int): Maximum timeout for API requests in seconds.
 
 Example:
@@ -33,12 +33,71 @@ Example:
     ```
 """
 
-from datetime import datetime, timedelta
+from contextlib import contextmanager
+import importlib
 import json
+import logging
+import random
+import shutil
+import threading
+import time
+import weakref
+from types import TracebackType
 from json import JSONDecodeError
 import requests
-import urllib
-from typing import Any, BinaryIO, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3 import BaseHTTPResponse
+from urllib3.connectionpool import ConnectionPool
+from urllib3.util.retry import Retry
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Literal, Optional
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kalpy._httpx_session import HttpxSession
+    from kalpy.activities import ActivitiesService
+    from kalpy.dashboards import DashboardsService
+    from kalpy.entity_fields import EntityFieldsService
+    from kalpy.entity_types import EntityTypesService
+    from kalpy.exports import ExportsService
+    from kalpy.imports import ImportsService
+    from kalpy.labels import LabelsService
+    from kalpy.programs import ProgramsService
+    from kalpy.property_fields import PropertyFieldsService
+    from kalpy.record_views import RecordViewsService
+    from kalpy.records import RecordsService
+    from kalpy.workspace import WorkspaceService
+
+# Bodies are encoded and decoded with the fastest JSON library available; msgspec
+# and orjson are optional (the `speedups` extra) and the standard library is used
+# when neither is installed.
+_json_dumps: Callable[[Any], bytes]
+_json_loads: Callable[[bytes], Any]
+_JSON_DECODE_ERRORS: tuple[type[Exception], ...]
+try:
+    import msgspec
+
+    _json_dumps = msgspec.json.encode
+    _json_loads = msgspec.json.decode
+    _JSON_DECODE_ERRORS = (msgspec.DecodeError, JSONDecodeError)
+except ImportError:
+    try:
+        import orjson
+
+        _json_dumps = orjson.dumps
+        _json_loads = orjson.loads
+        _JSON_DECODE_ERRORS = (orjson.JSONDecodeError,)
+    except ImportError:
+
+        def _json_dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+
+        _json_loads = json.loads
+        _JSON_DECODE_ERRORS = (JSONDecodeError, UnicodeDecodeError)
+
+_logger = logging.getLogger(__name__)
+
+# Error bodies are logged up to this many characters
+_ERROR_BODY_LIMIT = 512
 
 PROD_API_URL = "https://api.kaleidoscope.bio"
 """The production URL for the Kaleidoscope API.
@@ -46,18 +105,127 @@ PROD_API_URL = "https://api.kaleidoscope.bio"
 This is the default url used for the `KaleidoscopeClient`, in the event
 no url is provided in the `KaleidoscopeClient`'s initialization"""
 
-VALID_CONTENT_TYPES = [
-    "text/csv",
-    "chemical/x-mdl-sdfile",
-    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-]
-"""List of acceptable content types for file downloads.
+VALID_CONTENT_TYPES = frozenset(
+    {
+        "text/csv",
+        "chemical/x-mdl-sdfile",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    }
+)
+"""Set of acceptable content types for file downloads.
 
-Any file retrieved by the `KaleidoscopeClient` must be of one the above types"""
+Any file retrieved by the `KaleidoscopeClient` must be of one the above types.
+Parameters such as `; charset=utf-8` are ignored when checking."""
 
 TIMEOUT_MAXIMUM = 10
 """Maximum timeout for API requests in seconds."""
 
+_REFRESH_BUFFER = 60 * 10  # seconds before expiry the token is considered stale
+_REFRESH_JITTER = 60 * 2  # random extra buffer so clients don't refresh in lockstep
+_REFRESH_LEAD = 60  # seconds before that deadline the background refresh runs
+_REFRESH_RETRY_MAXIMUM = 60 * 5
+
+_RETRY_STATUSES = (429, 502, 503, 504)
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+# Attribute name -> (module, class) of the services created on first access
+_SERVICES: dict[str, tuple[str, str]] = {
+    "activities": ("kalpy.activities", "ActivitiesService"),
+    "dashboards": ("kalpy.dashboards", "DashboardsService"),
+    "entity_fields": ("kalpy.entity_fields", "EntityFieldsService"),
+    "entity_types": ("kalpy.entity_types", "EntityTypesService"),
+    "exports": ("kalpy.exports", "ExportsService"),
+    "imports": ("kalpy.imports", "ImportsService"),
+    "labels": ("kalpy.labels", "LabelsService"),
+    "property_fields": ("kalpy.property_fields", "PropertyFieldsService"),
+    "programs": ("kalpy.programs", "ProgramsService"),
+    "record_views": ("kalpy.record_views", "RecordViewsService"),
+    "records": ("kalpy.records", "RecordsService"),
+    "workspace": ("kalpy.workspace", "WorkspaceService"),
+}
+
+
+class KaleidoscopeAPIError(Exception):
+    """Raised when the API rejects a request with a client error (4xx).
+
+    Rate limiting (429) is retried instead, and server errors that persist after
+    retrying are logged and reported as a None result.
+
+    Attributes:
+        method (str): The HTTP method of the request.
+        url (str): The URL of the request.
+        status_code (int): The HTTP status code of the response.
+        body (str): The start of the response body.
+    """
+
+    def __init__(self, method: str, url: str, status_code: int, body: str):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.body = body
+        super().__init__(f"{method} {url} received {status_code}: {body}")
+
+
+class KaleidoscopeAuthError(KaleidoscopeAPIError):
+    """Raised when the client cannot obtain an access token.
+
+    Requests are not sent without credentials: the first request made before the
+    client has authenticated raises this error instead.
+    """
+
+
+def _raise_for_client_error(method: str, resp: Any, body: Any) -> None:
+    if 400 <= resp.status_code < 500 and resp.status_code != 429:
+        if isinstance(body, bytes):
+            body = body.decode(errors="replace")
+        raise KaleidoscopeAPIError(
+            method, str(resp.url), resp.status_code, body[:_ERROR_BODY_LIMIT]
+        )
+
+
+class _Retry(Retry):
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        # A POST answered with a server error may already have been applied, so
+        # only a rate-limited one, refused before processing, is sent again.
+        if method.upper() == "POST":
+            return bool(self.total) and status_code == 429
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(
+        self,
+        method: Optional[str] = None,
+        url: Optional[str] = None,
+        response: Optional[BaseHTTPResponse] = None,
+        error: Optional[Exception] = None,
+        _pool: Optional[ConnectionPool] = None,
+        _stacktrace: Optional[TracebackType] = None,
+    ) -> Retry:
+        # Likewise a POST that failed once it was sent is not sent again; only one
+        # that never reached the server is.
+        if (
+            error is not None
+            and method is not None
+            and method.upper() == "POST"
+            and not self._is_connection_error(error)
+        ):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+# Requests are retried with backoff when rate limited, and idempotent ones also when
+# the gateway is briefly unavailable. Both transports share this policy.
+_RETRY_POLICY = _Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=_RETRY_STATUSES,
+    allowed_methods=frozenset({"GET", "PUT", "DELETE"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
 
 class TokenResponse:
     access_token: str
@@ -95,118 +263,309 @@ class KaleidoscopeClient:
         }
         # Use the client to interact with various services
         programs = client.activities.get_activities()
+
+        # Or close its connections when the block exits
+        with KaleidoscopeClient(client_id, client_secret) as client:
+            activities = client.activities.get_activities()
         ```
     """
 
     _client_id: str
     _client_secret: str
 
-    _refresh_token: str
-    _access_token: str
-    _refresh_before: datetime
+    activities: "ActivitiesService"
+    dashboards: "DashboardsService"
+    entity_fields: "EntityFieldsService"
+    entity_types: "EntityTypesService"
+    exports: "ExportsService"
+    imports: "ImportsService"
+    labels: "LabelsService"
+    property_fields: "PropertyFieldsService"
+    programs: "ProgramsService"
+    record_views: "RecordViewsService"
+    records: "RecordsService"
+    workspace: "WorkspaceService"
+
+    _refresh_token: Optional[str]
+    _access_token: Optional[str]
+    _refresh_deadline: float  # time.monotonic() value
+    _headers: dict[str, str]
+    _json_headers: dict[str, str]
 
     def __init__(
         self,
         client_id: str,
         client_secret: str,
         url: Optional[str] = None,
+        transport: Literal["requests", "httpx"] = "requests",
     ):
         """Initialize the Kaleidoscope API client.
 
-        Sets up the client with API credentials and optional API URL, and initializes
-        service interfaces for interacting with different API endpoints.
+        Sets up the client with API credentials and optional API URL. No request is
+        made here: the client authenticates on its first API request, which raises
+        `KaleidoscopeAuthError` if that fails, and the service interfaces for the
+        different API endpoints are created on first access.
 
         Args:
             client_id (str): The API client ID for authentication.
             client_secret (str): The API client secret for authentication.
             url (Optional[str]): The base URL for the API. Defaults to the production
                 API URL if not provided.
+            transport (Literal["requests", "httpx"]): The HTTP library requests are
+                sent with. "httpx" uses HTTP/2, which multiplexes concurrent
+                requests over one connection, and requires the optional
+                `httpx[http2]` package (the `http2` extra of kalpy). Both retry
+                rate-limited and unavailable responses the same way. Defaults to
+                "requests".
         """
-        from kalpy.activities import ActivitiesService
-        from kalpy.dashboards import DashboardsService
-        from kalpy.entity_fields import EntityFieldsService
-        from kalpy.entity_types import EntityTypesService
-        from kalpy.exports import ExportsService
-        from kalpy.imports import ImportsService
-        from kalpy.labels import LabelsService
-        from kalpy.programs import ProgramsService
-        from kalpy.property_fields import PropertyFieldsService
-        from kalpy.record_views import RecordViewsService
-        from kalpy.records import RecordsService
-        from kalpy.workspace import WorkspaceService
-
         self._api_url = url if url else PROD_API_URL
-
-        self.activities = ActivitiesService(self)
-        self.dashboards = DashboardsService(self)
-        self.entity_fields = EntityFieldsService(self)
-        self.entity_types = EntityTypesService(self)
-        self.exports = ExportsService(self)
-        self.imports = ImportsService(self)
-        self.labels = LabelsService(self)
-        self.property_fields = PropertyFieldsService(self)
-        self.programs = ProgramsService(self)
-        self.record_views = RecordViewsService(self)
-        self.records = RecordsService(self)
-        self.workspace = WorkspaceService(self)
+        self._token_url = self._api_url + "/auth/oauth/token"
+        self._session = self._create_session(transport)
+        self._token_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        # request_scope memo, one per thread so concurrent scopes stay separate
+        self._request_scope = threading.local()
+        self._services_lock = threading.Lock()
 
         self._client_id = client_id
         self._client_secret = client_secret
-        self._get_auth_token()
+        # authenticated on the first request, through _get_headers
+        self._access_token = None
+        self._refresh_token = None
+        self._refresh_deadline = 0.0
+        self._headers = {}
+        self._json_headers = {"Content-Type": "application/json"}
+
+    def __getattr__(self, name: str) -> Any:
+        # Services are created on first access, which also defers importing their
+        # modules (they import this one) until they are needed.
+        try:
+            module_name, class_name = _SERVICES[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            ) from None
+
+        with self._services_lock:
+            service = self.__dict__.get(name)
+            if service is None:
+                module = importlib.import_module(module_name)
+                service = getattr(module, class_name)(self)
+                # later lookups find the instance attribute and skip __getattr__
+                self.__dict__[name] = service
+        return service
+
+    @staticmethod
+    def _create_session(
+        transport: Literal["requests", "httpx"],
+    ) -> "requests.Session | HttpxSession":
+        if transport == "httpx":
+            from kalpy._httpx_session import HttpxSession
+
+            return HttpxSession(timeout=TIMEOUT_MAXIMUM, status_retry=_RETRY_POLICY)
+        if transport != "requests":
+            raise ValueError(f"Unknown transport: {transport!r}")
+
+        # One pooled session keeps connections to the API alive between requests
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=20, max_retries=_RETRY_POLICY
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the connections held by the client and stop refreshing its token."""
+        with self._token_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+        self._session.close()
+
+    def __enter__(self) -> "KaleidoscopeClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def _update_tokens(self, data: TokenResponse):
-        self._access_token = data.get("access_token")
-        self._refresh_token = data.get("refresh_token")
-        self._last_refreshed_at = datetime.now() + timedelta(
-            seconds=data.get("expires_in") - (60 * 10)  # add a 10 minute buffer
+        expires_in = data.get("expires_in")
+        # a short-lived token is refreshed halfway through its lifetime, rather than
+        # at once and then every second after that
+        buffer = min(
+            _REFRESH_BUFFER + random.randint(0, _REFRESH_JITTER), expires_in / 2
         )
+        refresh_in = max(0.0, expires_in - buffer)
+        with self._token_lock:
+            self._access_token = data.get("access_token")
+            self._refresh_token = data.get("refresh_token")
+            self._refresh_deadline = time.monotonic() + refresh_in
+            # built once per token; request methods share them and must not modify
+            # them. Multipart uploads leave Content-Type to requests.
+            self._headers = {"Authorization": f"Bearer {self._access_token}"}
+            self._json_headers = {**self._headers, "Content-Type": "application/json"}
+        self._schedule_refresh(max(1, refresh_in - min(_REFRESH_LEAD, refresh_in / 2)))
+
+    def _schedule_refresh(self, delay: float, attempt: int = 0):
+        # The timer only holds a weak reference, so a discarded client is not kept
+        # alive (and refreshing) by its own timer.
+        client_ref = weakref.ref(self)
+
+        def refresh():
+            client = client_ref()
+            if client is not None:
+                client._background_refresh(attempt)
+
+        timer = threading.Timer(delay, refresh)
+        timer.daemon = True
+        with self._token_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+            self._refresh_timer = timer
+        timer.start()
+
+    def _background_refresh(self, attempt: int):
+        try:
+            with self._refresh_lock:
+                self._refresh_auth_token()
+            refreshed = True
+        except (requests.RequestException, KaleidoscopeAuthError) as e:
+            _logger.error("Could not refresh access token: %s", e)
+            refreshed = False
+
+        if not refreshed:
+            # back off, falling back to the inline refresh in _get_headers meanwhile
+            self._schedule_refresh(
+                min(2**attempt * 5, _REFRESH_RETRY_MAXIMUM), attempt + 1
+            )
 
-    def _get_auth_token(self):
-        auth_resp = requests.post(
-            self._api_url + "/auth/oauth/token",
-            data={
-                "grant_type": "client_credentials",
-                "client_id": self._client_id,
-                "client_secret": self._client_secret,
-            },
+    def _request_token(self, data: dict) -> None:
+        auth_resp = self._session.post(
+            self._token_url, data=data, timeout=TIMEOUT_MAXIMUM
         )
         if auth_resp.status_code >= 400:
-            print(
-                f"Could not connect to server with client_id {self._client_id}: ",
-                auth_resp.content,
+            raise KaleidoscopeAuthError(
+                "POST",
+                self._token_url,
+                auth_resp.status_code,
+                auth_resp.text[:_ERROR_BODY_LIMIT],
             )
-            return None
 
         self._update_tokens(auth_resp.json())
 
-    def _refresh_auth_token(self):
+    def _get_auth_token(self) -> None:
+        self._request_token(
+            {
+                "grant_type": "client_credentials",
+                "client_id": self._client_id,
+                "client_secret": self._client_secret,
+            }
+        )
+
+    def _refresh_auth_token(self) -> None:
         if self._refresh_token is None:
-            return self._get_auth_token()
-
-        auth_resp = requests.post(
-            self._api_url + "/auth/oauth/token",
-            data={
-                "grant_type": "refresh_token",
-                "refresh_token": self._refresh_token,
-            },
+            self._get_auth_token()
+            return
+
+        self._request_token(
+            {"grant_type": "refresh_token", "refresh_token": self._refresh_token}
         )
-        if auth_resp.status_code >= 400:
-            print(
-                f"Could not refresh access token: ",
-                auth_resp.content,
-            )
-            return None
 
-        self._update_tokens(auth_resp.json())
+    def _get_headers(self, json_body: bool = False):
+        # normally refreshed in the background; this covers clock skew and failures
+        if time.monotonic() >= self._refresh_deadline:
+            # only one thread refreshes; the others wait for it and reuse the result
+            with self._refresh_lock:
+                if time.monotonic() >= self._refresh_deadline:
+                    try:
+                        self._refresh_auth_token()
+                    except KaleidoscopeAuthError as e:
+                        # without a token the request would go out unauthenticated
+                        if not self._headers:
+                            raise
+                        _logger.error("Could not refresh access token: %s", e)
+
+        return self._json_headers if json_body else self._headers
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        data: Optional[dict] = None,
+        files: Optional[dict] = None,
+        stream: bool = False,
+    ) -> Any:
+        """Send a request to the API and check its status.
 
-    def _get_headers(self):
-        if datetime.now() > self._last_refreshed_at:
-            self._refresh_auth_token()
+        Every request method goes through here, so authentication, encoding, retries
+        and error reporting are handled in one place.
 
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self._access_token}",
-        }
+        Args:
+            method (str): The HTTP method.
+            url (str): The endpoint URL, relative to the API base URL.
+            params (Optional[Dict[str, Any]]): Query parameters. Defaults to None.
+            json (Any): Data sent as the JSON body. Defaults to None.
+            data (Optional[dict]): Form fields, sent along with `files`. Defaults to
+                None.
+            files (Optional[dict]): Files sent as multipart form data. Defaults to
+                None.
+            stream (bool): Whether to leave the body unread for streaming. Defaults
+                to False.
+
+        Returns:
+            Any: The response, or None if the server failed.
+
+        Raises:
+            KaleidoscopeAPIError: If the API rejects the request with a 4xx error.
+            KaleidoscopeAuthError: If the client has no access token and cannot
+                obtain one.
+        """
+        if json is not None:
+            data = _json_dumps(json)
+        resp = self._session.request(
+            method,
+            self._api_url + url,
+            params=params,
+            data=data,
+            files=files,
+            headers=self._get_headers(json_body=json is not None),
+            timeout=TIMEOUT_MAXIMUM,
+            stream=stream,
+        )
+        if resp.status_code < 400:
+            return resp
+
+        if stream:
+            # the body is streamed; read only what is reported
+            raw_body = resp.raw.read(_ERROR_BODY_LIMIT, decode_content=True)
+            resp.close()
+            body = raw_body.decode(errors="replace")
+        else:
+            body = resp.text
+        _raise_for_client_error(method, resp, body)
+        _logger.error(
+            "%s %s received %d: %.*s",
+            method,
+            resp.url,
+            resp.status_code,
+            _ERROR_BODY_LIMIT,
+            body,
+        )
+        return None
+
+    @staticmethod
+    def _decode(resp: Any) -> Any:
+        if resp is None:
+            return None
+        try:
+            return _json_loads(resp.content)
+        except _JSON_DECODE_ERRORS:
+            return None
 
     def _post(self, url: str, payload: dict) -> Any:
         """Send a POST request to the specified URL with the given payload.
@@ -219,23 +578,13 @@ class KaleidoscopeClient:
 
         Returns:
             Any: The JSON response from the server if the request is successful
-            and the response is valid JSON. Returns None if the request fails
+            and the response is valid JSON. Returns None if the server fails
             or the response cannot be decoded.
-        """
 
-        resp = requests.post(
-            self._api_url + url,
-            data=json.dumps(payload),
-            headers=self._get_headers(),
-            timeout=TIMEOUT_MAXIMUM,
-        )
-        if resp.status_code >= 400:
-            print(f"POST {url} received {resp.status_code}: ", resp.content)
-            return None
-        try:
-            return resp.json()
-        except JSONDecodeError:
-            return None
+        Raises:
+            KaleidoscopeAPIError: If the API rejects the request with a 4xx error.
+        """
+        return self._decode(self._request("POST", url, json=payload))
 
     def _post_file(
         self, url: str, file_data: tuple[str, BinaryIO, str], body: Any = None
@@ -251,28 +600,18 @@ class KaleidoscopeClient:
 
         Returns:
             Any: The JSON response from the server if the request is successful.
-            Returns None if the request fails or the response cannot be decoded.
-        """
-        files = {"file": file_data}
+            Returns None if the server fails or the response cannot be decoded.
 
+        Raises:
+            KaleidoscopeAPIError: If the API rejects the request with a 4xx error.
+        """
         form_data = {}
         if body:
-            form_data["body"] = json.dumps(body)
+            form_data["body"] = _json_dumps(body).decode()
 
-        resp = requests.post(
-            self._api_url + url,
-            files=files,
-            data=form_data,
-            headers=self._get_headers(),
-            timeout=TIMEOUT_MAXIMUM,
+        return self._decode(
+            self._request("POST", url, data=form_data, files={"file": file_data})
         )
-        if resp.status_code >= 400:
-            print(f"POST {url} received {resp.status_code}: ", resp.content)
-            return None
-        try:
-            return resp.json()
-        except JSONDecodeError:
-            return None
 
     def _put(self, url: str, payload: dict) -> Any:
         """Send a PUT request to the specified URL with the provided payload.
@@ -283,22 +622,12 @@ class KaleidoscopeClient:
 
         Returns:
             Any: The JSON response from the server if the request is successful.
-            Returns None if the request fails or the response cannot be decoded.
-        """
+            Returns None if the server fails or the response cannot be decoded.
 
-        resp = requests.put(
-            self._api_url + url,
-            data=json.dumps(payload),
-            headers=self._get_headers(),
-            timeout=TIMEOUT_MAXIMUM,
-        )
-        if resp.status_code >= 400:
-            print(f"PUT {url} received {resp.status_code}: ", resp.content)
-            return None
-        try:
-            return resp.json()
-        except JSONDecodeError:
-            return None
+        Raises:
+            KaleidoscopeAPIError: If the API rejects the request with a 4xx error.
+        """
+        return self._decode(self._request("PUT", url, json=payload))
 
     def _get(self, url: str, params: Optional[Dict[str, Any]] = None) -> Any:
         """Send a GET request to the specified API endpoint with optional query parameters.
@@ -310,20 +639,88 @@ class KaleidoscopeClient:
 
         Returns:
             Any: The JSON response from the server if the request is successful.
-            Returns None if the request fails or the response cannot be decoded.
+            Returns None if the server fails or the response cannot be decoded.
+
+        Raises:
+            KaleidoscopeAPIError: If the API rejects the request with a 4xx error.
         """
-        url = self._api_url + url
-        if params:
-            url += "?" + urllib.parse.urlencode(params)
+        return self._decode(self._request("GET", url, params=params))
+
+    @contextmanager
+    def request_scope(self) -> Iterator[None]:
+        """Share the responses of repeated GET requests within a block.
+
+        Inside the block, relations loaded through cached properties (such as
+        `Activity.child_activities` and `Activity.records`) request each URL at most
+        once, even when reached from different objects of a traversal. The responses
+        are discarded when the outermost block exits, so later reads see fresh data.
+
+        Each thread has its own scope: requests made by other threads, including
+        those started inside the block, neither see nor share its responses, unless
+        they run a function wrapped with `_in_request_scope`.
+
+        Example:
+            ```python
+            with client.request_scope():
+                for activity in client.activities.get_activities():
+                    for child in activity.child_activities:
+                        ...
+            ```
+        """
+        scope = self._request_scope
+        if getattr(scope, "memo", None) is not None:
+            yield
+            return
 
-        resp = requests.get(url, headers=self._get_headers(), timeout=TIMEOUT_MAXIMUM)
-        if resp.status_code >= 400:
-            print(f"GET {url} received {resp.status_code}", resp.content)
-            return None
+        scope.memo = {}
         try:
-            return resp.json()
-        except JSONDecodeError:
-            return None
+            yield
+        finally:
+            scope.memo = None
+
+    def _in_request_scope[R](self, func: Callable[[], R]) -> Callable[[], R]:
+        """Wrap `func` to run in the `request_scope` of the calling thread.
+
+        The wrapper can be run on another thread, such as a pool worker, and shares
+        the memoized responses of the thread that created it.
+        """
+        memo = getattr(self._request_scope, "memo", None)
+
+        def run() -> R:
+            scope = self._request_scope
+            previous = getattr(scope, "memo", None)
+            scope.memo = memo
+            try:
+                return func()
+            finally:
+                scope.memo = previous
+
+        return run
+
+    def _get_memo(self, url: str) -> Any:
+        """Send a GET request, reusing the response of an identical request made in
+        the current `request_scope`.
+
+        Outside of a `request_scope` on the calling thread this is the same as
+        `_get`. Failed requests are not memoized.
+
+        Args:
+            url (str): The API endpoint path to append to the base URL.
+
+        Returns:
+            Any: The JSON response from the server, or None if the request fails.
+        """
+        memo: Optional[Dict[str, Any]] = getattr(self._request_scope, "memo", None)
+        if memo is None:
+            return self._get(url)
+
+        if url not in memo:
+            resp = self._get(url)
+            if resp is None:
+                return None
+            memo[url] = resp
+
+        return memo[url]
 
     def _get_file(
         self, url: str, download_path: str, params: Optional[Dict[str, Any]] = None
@@ -340,34 +737,33 @@ class KaleidoscopeClient:
 
         Returns:
             (str | None): The path to the downloaded file if successful. Returns None
-            if the request fails or the response does not contain valid file data.
+            if the server fails or the response does not contain valid file data.
+
+        Raises:
+            KaleidoscopeAPIError: If the API rejects the request with a 4xx error.
 
         Note:
             Only responses with valid content types (as defined in VALID_CONTENT_TYPES)
             are saved.
         """
-        url = self._api_url + url
-        if params:
-            url += "?" + urllib.parse.urlencode(params)
-
-        resp = requests.get(
-            url, headers=self._get_headers(), stream=True, timeout=TIMEOUT_MAXIMUM
-        )
-        if resp.status_code >= 400:
-            print(f"GET {url} received {resp.status_code}", resp.content)
+        resp = self._request("GET", url, params=params, stream=True)
+        if resp is None:
             return None
 
         content_type = resp.headers.get("Content-Type", "")
-        if content_type not in VALID_CONTENT_TYPES:
-            print(
-                f"Invalid Content-Type: {content_type}. Response does not contain valid file data."
+        mime_type = content_type.split(";", 1)[0].strip().lower()
+        if mime_type not in VALID_CONTENT_TYPES:
+            resp.close()
+            _logger.error(
+                "Invalid Content-Type: %s. Response does not contain valid file data.",
+                content_type,
             )
             return None
 
+        # copy the raw stream in large blocks, letting urllib3 undo any gzip encoding
+        resp.raw.decode_content = True
         with open(download_path, "wb") as f_download:
-            for chunk in resp.iter_content(chunk_size=8192):
-                if chunk:
-                    f_download.write(chunk)
+            shutil.copyfileobj(resp.raw, f_download, length=_DOWNLOAD_CHUNK_SIZE)
 
         return download_path
 
@@ -381,19 +777,9 @@ class KaleidoscopeClient:
 
         Returns:
             Any: The JSON response from the server if the request is successful.
-            Returns None if the request fails or the response cannot be decoded.
-        """
-        url = self._api_url + url
-        if params:
-            url += "?" + urllib.parse.urlencode(params)
+            Returns None if the server fails or the response cannot be decoded.
 
-        resp = requests.delete(
-            url, headers=self._get_headers(), timeout=TIMEOUT_MAXIMUM
-        )
-        if resp.status_code >= 400:
-            print(f"DELETE {url} received {resp.status_code}", resp.content)
-            return None
-        try:
-            return resp.json()
-        except JSONDecodeError:
-            return None
+        Raises:
+            KaleidoscopeAPIError: If the API rejects the request with a 4xx error.
+        """
+        return self._decode(self._request("DELETE", url, params=params))
@@ -35,13 +35,15 @@ Example:
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import time
 from datetime import datetime
 from enum import Enum
-from functools import lru_cache
 from kalpy._kaleidoscope_model import _KaleidoscopeBaseModel
 from kalpy.client import KaleidoscopeClient
 from pydantic import TypeAdapter
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 _logger = logging.getLogger(__name__)
 
@@ -109,6 +111,32 @@ class DataFieldTypeEnum(str, Enum):
     S3_FILE = "s3-file"
     SNOWFLAKE_QUERY = "snowflake-query"
 
+    @classmethod
+    def from_value(cls, value: str) -> "DataFieldTypeEnum":
+        """Look up the field type with the given value.
+
+        Equivalent to `DataFieldTypeEnum(value)`, but a single dict lookup, which
+        is cheaper when mapping many raw strings.
+
+        Args:
+            value (str): The value of the field type, such as "number".
+
+        Returns:
+            DataFieldTypeEnum: The field type with that value.
+
+        Raises:
+            ValueError: If no field type has that value.
+        """
+        try:
+            return _FIELD_TYPE_BY_VALUE[value]
+        except KeyError:
+            raise ValueError(f"{value!r} is not a valid {cls.__name__}") from None
+
+
+_FIELD_TYPE_BY_VALUE: dict[str, DataFieldTypeEnum] = {
+    field_type.value: field_type for field_type in DataFieldTypeEnum
+}
+
 
 class EntityField(_KaleidoscopeBaseModel):
     """Represents a field within an entity in the Kaleidoscope system.
@@ -135,6 +163,19 @@ class EntityField(_KaleidoscopeBaseModel):
         return f"{self.field_name}"
 
 
+_ENTITY_FIELD_LIST_ADAPTER = TypeAdapter(List[EntityField])
+
+
+def _map_concurrently[T, R](
+    func: Callable[[T], R], items: List[T], max_concurrency: int
+) -> List[R]:
+    # results keep the order of items; a single item needs no thread
+    if len(items) > 1 and max_concurrency > 1:
+        with ThreadPoolExecutor(max_workers=min(max_concurrency, len(items))) as ex:
+            return list(ex.map(func, items))
+    return [func(item) for item in items]
+
+
 class EntityFieldsService:
     """Service class for managing key fields and data fields in Kaleidoscope.
 
@@ -144,28 +185,106 @@ class EntityFieldsService:
     - Data fields: Used to store additional information about entities
     """
 
-    def __init__(self, client: KaleidoscopeClient):
+    def __init__(self, client: KaleidoscopeClient, cache_ttl: Optional[float] = 60):
+        """Initialize the service.
+
+        Args:
+            client (KaleidoscopeClient): The client used to make requests.
+            cache_ttl (Optional[float]): Number of seconds the fetched key fields and
+                data fields stay cached. None keeps them until `clear_cache` is
+                called. Defaults to 60.
+        """
         self._client = client
+        self._cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+        self._fields_cache: dict[
+            str, tuple[float, List[EntityField], dict[str, EntityField]]
+        ] = {}
+        # one lock per url serializes its fetches; the generation is bumped on
+        # every invalidation, so a fetch that started before one is not cached
+        self._fetch_locks: dict[str, threading.Lock] = {}
+        self._cache_generation = 0
+
+    def _is_fresh(self, cached_at: float) -> bool:
+        return self._cache_ttl is None or time.monotonic() - cached_at < self._cache_ttl
+
+    def clear_cache(self) -> None:
+        """Discard the cached key fields and data fields."""
+        with self._cache_lock:
+            self._fields_cache.clear()
+            self._cache_generation += 1
+
+    def _cached(
+        self, url: str
+    ) -> Optional[tuple[List[EntityField], dict[str, EntityField]]]:
+        # must be called with the cache lock held
+        cached = self._fields_cache.get(url)
+        if cached is not None and self._is_fresh(cached[0]):
+            return cached[1], cached[2]
+        return None
+
+    def _fields(self, url: str) -> tuple[List[EntityField], dict[str, EntityField]]:
+        """Fetch the fields listed at `url`, along with an index by field name.
+
+        Both are cached together for `cache_ttl` seconds. The first field wins on
+        duplicate names. Errors are raised to the caller and are not cached.
+
+        Concurrent callers for the same url share one fetch, which runs outside
+        the cache lock. A result fetched while the cache was invalidated by a
+        create is returned but not cached.
+        """
+        with self._cache_lock:
+            cached = self._cached(url)
+            if cached is not None:
+                return cached
+            fetch_lock = self._fetch_locks.setdefault(url, threading.Lock())
+
+        with fetch_lock:
+            with self._cache_lock:
+                # filled by the caller that held the fetch lock before us
+                cached = self._cached(url)
+                if cached is not None:
+                    return cached
+                generation = self._cache_generation
+
+            resp = self._client._get(url)
+            fields = _ENTITY_FIELD_LIST_ADAPTER.validate_python(resp)
+            by_name = self._fields_by_name(fields)
+
+            with self._cache_lock:
+                if self._cache_generation == generation:
+                    self._fields_cache[url] = (time.monotonic(), fields, by_name)
+            return fields, by_name
+
+    def _invalidate(self, url: str) -> None:
+        with self._cache_lock:
+            self._fields_cache.pop(url, None)
+            self._cache_generation += 1
+
+    @staticmethod
+    def _fields_by_name(fields: List[EntityField]) -> dict[str, EntityField]:
+        # the first field wins on duplicate names, as in the cached index
+        by_name: dict[str, EntityField] = {}
+        for field in fields:
+            by_name.setdefault(field.field_name, field)
+        return by_name
 
-    @lru_cache
     def get_key_fields(self) -> List[EntityField]:
         """Retrieve the key fields from the client.
 
-        This method caches its values.
+        This method caches its values; see `cache_ttl`.
 
         Returns:
             List[EntityField]: A list of EntityField objects representing the key fields.
 
         Note:
-            If an exception occurs during the API request, it logs the error,
-            clears the cache, and returns an empty list.
+            If an exception occurs during the API request, it logs the error
+            and returns an empty list. Failed requests are not cached.
         """
         try:
-            resp = self._client._get("/key_fields")
-            return TypeAdapter(List[EntityField]).validate_python(resp)
+            return self._fields("/key_fields")[0]
         except Exception as e:
             _logger.error(f"Error fetching key fields: {e}")
-            self.get_key_fields.cache_clear()
             return []
 
     def get_key_field_by_name(self, name: str) -> EntityField | None:
@@ -177,11 +296,11 @@ class EntityFieldsService:
         Returns:
             (EntityField | None): The EntityField object with the specified name if found, otherwise None.
         """
-        fields = self.get_key_fields()
-        return next(
-            (f for f in fields if f.field_name == name),
-            None,
-        )
+        try:
+            return self._fields("/key_fields")[1].get(name)
+        except Exception as e:
+            _logger.error(f"Error fetching key fields: {e}")
+            return None
 
     def get_or_create_key_field(self, field_name: str) -> EntityField | None:
         """Retrieve an existing key field by name or create a new one if it does not exist.
@@ -196,30 +315,59 @@ class EntityFieldsService:
         try:
             data = {"field_name": field_name}
             resp = self._client._post("/key_fields/", data)
+            self._invalidate("/key_fields")
             return EntityField.model_validate(resp)
         except Exception as e:
             _logger.error(f"Error getting or creating key field: {e}")
             return None
 
-    @lru_cache
+    def get_or_create_key_fields(
+        self, field_names: List[str], max_concurrency: int = 8
+    ) -> List[EntityField | None]:
+        """Retrieve or create several key fields at once.
+
+        Fields that already exist are taken from `get_key_fields`, so only the
+        missing ones are created, each with one request. Those requests are sent
+        concurrently.
+
+        Args:
+            field_names (List[str]): The names of the key fields to retrieve or create.
+            max_concurrency (int): The maximum number of create requests in flight
+                at once. Defaults to 8.
+
+        Returns:
+            List[EntityField | None]: The key fields in the order of `field_names`,
+                with None for any field that could not be created.
+        """
+        fields = self._fields_by_name(self.get_key_fields())
+        missing = list(dict.fromkeys(n for n in field_names if n not in fields))
+        created = _map_concurrently(
+            self.get_or_create_key_field, missing, max_concurrency
+        )
+        fields.update(
+            (field_name, field)
+            for field_name, field in zip(missing, created)
+            if field is not None
+        )
+
+        return [fields.get(field_name) for field_name in field_names]
+
     def get_data_fields(self) -> List[EntityField]:
         """Retrieve the list of data fields available in the workspace.
 
-        This method caches its values.
+        This method caches its values; see `cache_ttl`.
 
         Returns:
             List[EntityField]: A list of EntityField objects representing the data fields.
 
         Note:
-            If an exception occurs during the API request, it logs the error,
-            clears the cache, and returns an empty list.
+            If an exception occurs during the API request, it logs the error
+            and returns an empty list. Failed requests are not cached.
         """
         try:
-            resp = self._client._get("/data_fields")
-            return TypeAdapter(List[EntityField]).validate_python(resp)
+            return self._fields("/data_fields")[0]
         except Exception as e:
             _logger.error(f"Error fetching data fields: {e}")
-            self.get_data_fields.cache_clear()
             return []
 
     def get_data_field_by_name(self, name: str) -> EntityField | None:
@@ -231,11 +379,11 @@ class EntityFieldsService:
         Returns:
             (EntityField | None): The data field object with the specified name if found, otherwise None.
         """
-        fields = self.get_data_fields()
-        return next(
-            (f for f in fields if f.field_name == name),
-            None,
-        )
+        try:
+            return self._fields("/data_fields")[1].get(name)
+        except Exception as e:
+            _logger.error(f"Error fetching data fields: {e}")
+            return None
 
     def get_or_create_data_field(
         self, field_name: str, field_type: DataFieldTypeEnum
@@ -259,7 +407,47 @@ class EntityFieldsService:
                 "attrs": {},
             }
             resp = self._client._post("/data_fields/", data)
+            self._invalidate("/data_fields")
             return EntityField.model_validate(resp)
         except Exception as e:
             _logger.error(f"Error getting or creating data field: {e}")
             return None
+
+    def get_or_create_data_fields(
+        self, specs: List[tuple[str, DataFieldTypeEnum]], max_concurrency: int = 8
+    ) -> List[EntityField | None]:
+        """Create several data fields or return the existing ones.
+
+        Fields that already exist are taken from `get_data_fields`, so only the
+        missing ones are created, each with one request. Those requests are sent
+        concurrently.
+
+        Args:
+            specs (List[tuple[str, DataFieldTypeEnum]]): The name and type of each
+                data field to create or retrieve.
+            max_concurrency (int): The maximum number of create requests in flight
+                at once. Defaults to 8.
+
+        Returns:
+            List[EntityField | None]: The data fields in the order of `specs`, with
+                None for any field that could not be created.
+        """
+        fields = self._fields_by_name(self.get_data_fields())
+        # the first type given for a name is the one it is created with
+        missing: dict[str, DataFieldTypeEnum] = {}
+        for field_name, field_type in specs:
+            if field_name not in fields:
+                missing.setdefault(field_name, field_type)
+
+        created = _map_concurrently(
+            lambda spec: self.get_or_create_data_field(*spec),
+            list(missing.items()),
+            max_concurrency,
+        )
+        fields.update(
+            (field_name, field)
+            for field_name, field in zip(missing, created)
+            if field is not None
+        )
+
+        return [fields.get(field_name) for field_name, _ in specs]
@@ -58,7 +58,9 @@ class EntityType(_KaleidoscopeBaseModel):
             and returns an empty list.
         """
         try:
-            resp = self._client._get("/records/search?entity_slice_id=" + self.id)
+            resp = self._client._get(
+                "/records/search", {"entity_slice_id": self.id}
+            )
             return resp
         except Exception as e:
             _logger.error(f"Error fetching record_ids of this entity type: {e}")
@@ -84,6 +86,12 @@ class EntityTypesService:
 
     def __init__(self, client: KaleidoscopeClient):
         self._client = client
+        self._index: tuple[
+            List[EntityType],
+            List[frozenset[str]],
+            dict[str, EntityType],
+            dict[frozenset[str], EntityType],
+        ] = ([], [], {}, {})
 
     def _create_entity_type(self, data: dict) -> EntityType:
         """Create an EntityType instance from the provided data dictionary.
@@ -141,6 +149,32 @@ class EntityTypesService:
             self.get_types.cache_clear()
             return []
 
+    def _indexes(
+        self,
+    ) -> tuple[
+        List[EntityType],
+        List[frozenset[str]],
+        dict[str, EntityType],
+        dict[frozenset[str], EntityType],
+    ]:
+        """Index the cached entity types by slice name and by key field set.
+
+        Returns the entity types from `get_types` with the key field set of each,
+        along with the two lookup dicts. The indexes are rebuilt whenever
+        `get_types` returns a different list. The first entity type wins on
+        duplicate names or key field sets.
+        """
+        entity_types = self.get_types()
+        indexed, key_sets, by_name, by_keys = self._index
+        if indexed is not entity_types:
+            key_sets = [frozenset(et.key_field_ids) for et in entity_types]
+            by_name, by_keys = {}, {}
+            for et, keys in zip(entity_types, key_sets):
+                by_name.setdefault(et.slice_name, et)
+                by_keys.setdefault(keys, et)
+            self._index = (entity_types, key_sets, by_name, by_keys)
+        return entity_types, key_sets, by_name, by_keys
+
     def get_type_by_name(self, name: str) -> EntityType | None:
         """Retrieve an EntityType object from the list of entity types by its name.
 
@@ -150,11 +184,8 @@ class EntityTypesService:
         Returns:
             (EntityType | None): The EntityType object with the matching name if found, otherwise None.
         """
-        entity_types = self.get_types()
-        return next(
-            (et for et in entity_types if et.slice_name == name),
-            None,
-        )
+        _, _, by_name, _ = self._indexes()
+        return by_name.get(name)
 
     def get_types_with_key_fields(self, key_field_ids: List[str]) -> List[EntityType]:
         """Return a list of EntityType objects that contain all the specified key field IDs.
@@ -165,12 +196,9 @@ class EntityTypesService:
         Returns:
             List[EntityType]: A list of EntityType instances where each entity type includes all the given key field IDs.
         """
-        entity_types = self.get_types()
-        return [
-            et
-            for et in entity_types
-            if all([id in et.key_field_ids for id in key_field_ids])
-        ]
+        entity_types, key_sets, _, _ = self._indexes()
+        target = frozenset(key_field_ids)
+        return [et for et, keys in zip(entity_types, key_sets) if target <= keys]
 
     def get_type_exact_keys(self, key_field_ids: List[str]) -> EntityType | None:
         """Retrieve an EntityType object whose key_field_ids exactly match the provided list.
@@ -181,8 +209,5 @@ class EntityTypesService:
         Returns:
             (EntityType | None): The matching EntityType object if found; otherwise, None.
         """
-        entity_types = self._client.entity_types.get_types()
-        return next(
-            (et for et in entity_types if set(et.key_field_ids) == set(key_field_ids)),
-            None,
-        )
+        _, _, _, by_keys = self._indexes()
+        return by_keys.get(frozenset(key_field_ids))
@@ -19,8 +19,11 @@ Example:
     ```
 """
 
+import logging
 from typing import Optional
-from kalpy.client import KaleidoscopeClient
+from kalpy.client import KaleidoscopeAPIError, KaleidoscopeClient
+
+_logger = logging.getLogger(__name__)
 
 
 class ExportsService:
@@ -117,10 +120,12 @@ class ExportsService:
         )
 
         url = "/records/export/csv"
-        file = self._client._get_file(
-            url,
-            f"{download_path if download_path else "/tmp"}/{filename}",
-            params,
-        )
-
-        return file
+        try:
+            return self._client._get_file(
+                url,
+                f"{download_path if download_path else "/tmp"}/{filename}",
+                params,
+            )
+        except KaleidoscopeAPIError as e:
+            _logger.error(f"Error exporting records: {e}")
+            return None
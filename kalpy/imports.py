@@ -25,9 +25,12 @@ Example:
     ```
 """
 
+import logging
 from typing import Any, Optional
 from kalpy.client import KaleidoscopeClient
 
+_logger = logging.getLogger(__name__)
+
 
 class ImportsService:
     """Service class for handling data imports into Kaleidoscope workspace.
@@ -67,7 +70,11 @@ class ImportsService:
             set_name (str, optional): Name of the set to which the imported data belongs.
 
         Returns:
-            Any: Response object from the client's POST request to the import endpoint.
+            Any: Response object from the client's POST request to the import endpoint,
+                or None if the request fails.
+
+        Note:
+            If an exception occurs during the API request, it logs the error and returns None.
         """
         payload = {
             "key_field_names": key_field_names,
@@ -86,4 +93,8 @@ class ImportsService:
         if source_id:
             url = url + f"/{source_id}"
 
-        return self._client._post(url, payload)
+        try:
+            return self._client._post(url, payload)
+        except Exception as e:
+            _logger.error(f"Error pushing data: {e}")
+            return None
@@ -93,4 +93,5 @@ class ProgramsService:
             List[Program]: A list of Program instances with IDs found in ids.
         """
         programs = self.get_programs()
-        return [program for program in programs if program.id in ids]
+        wanted = set(ids)
+        return [program for program in programs if program.id in wanted]
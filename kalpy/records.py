@@ -45,19 +45,77 @@ Example:
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from enum import Enum
-import json
 from kalpy._kaleidoscope_model import _KaleidoscopeBaseModel
-from kalpy.client import KaleidoscopeClient
-from pydantic import TypeAdapter
-from typing import TYPE_CHECKING, Any, BinaryIO, Dict, List, Optional, TypedDict, Unpack
+from kalpy.client import KaleidoscopeClient, _json_dumps
+from pydantic import ConfigDict, PrivateAttr, TypeAdapter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Dict,
+    List,
+    Optional,
+    TypedDict,
+    Unpack,
+)
 
 if TYPE_CHECKING:
     from kalpy.activities import Activity
 
 _logger = logging.getLogger(__name__)
 
+# Fields with at least this many values are indexed by record and activity for
+# lookups; scanning shorter lists is cheaper than maintaining the index
+_INDEX_MIN_VALUES = 64
+
+
+class _ValuesIndex:
+    """Positions of a field's values by record and activity, with memoized lookups.
+
+    The index describes one list object at one length; it is replaced when the
+    field's list is replaced or changes length.
+    """
+
+    __slots__ = ("values", "size", "by_record_id", "by_operation_id", "latest")
+
+    def __init__(self, values: List["RecordValue"]):
+        self.values = values
+        self.size = len(values)
+        self.by_record_id: dict[Optional[str], List[int]] = {}
+        self.by_operation_id: dict[Optional[str], List[int]] = {}
+        for position, value in enumerate(values):
+            self.by_record_id.setdefault(value.record_id, []).append(position)
+            self.by_operation_id.setdefault(value.operation_id, []).append(position)
+        # (activity_id, include_sub_record_values, sub_record_id) -> latest value
+        self.latest: dict[tuple, Optional["RecordValue"]] = {}
+
+    def is_current(self, values: List["RecordValue"]) -> bool:
+        return self.values is values and self.size == len(values)
+
+    def candidates(
+        self, activity_id: Optional[str], sub_record_id: Optional[str]
+    ) -> List["RecordValue"]:
+        # the values of the sub-record, or of the activity plus the key values,
+        # in their order in the list
+        if sub_record_id:
+            positions = self.by_record_id.get(sub_record_id, [])
+        else:
+            # both lists are in list order, so sorting only merges the two runs
+            positions = sorted(
+                self.by_operation_id.get(activity_id, [])
+                + self.by_record_id.get(None, [])
+            )
+        values = self.values
+        return [values[position] for position in positions]
+
+
+def _parse_datetime(value: Any) -> Any:
+    # the API sends ISO 8601 timestamps; anything else is passed through unchanged
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
 
 class FilterRuleTypeEnum(str, Enum):
     """Enumeration of filter rule types for record filtering operations.
@@ -207,6 +265,13 @@ class RecordValue(_KaleidoscopeBaseModel):
     def __str__(self):
         return f"{self.content}"
 
+    @classmethod
+    def _from_trusted(cls, data: dict) -> "RecordValue":
+        fields = dict(data)
+        if "created_at" in fields:
+            fields["created_at"] = _parse_datetime(fields["created_at"])
+        return cls.model_construct(**fields)
+
 
 class Record(_KaleidoscopeBaseModel):
     """Represents a record in the Kaleidoscope system.
@@ -233,9 +298,22 @@ class Record(_KaleidoscopeBaseModel):
     initial_operation_id: Optional[str] = None
     sub_record_ids: List[str]
 
+    _values_index: dict[str, _ValuesIndex] = PrivateAttr(default_factory=dict)
+
     def __str__(self):
         return f"{self.record_identifier}"
 
+    @classmethod
+    def _from_trusted(cls, data: dict) -> "Record":
+        fields = dict(data)
+        if "created_at" in fields:
+            fields["created_at"] = _parse_datetime(fields["created_at"])
+        fields["record_values"] = {
+            field_id: [RecordValue._from_trusted(value) for value in values]
+            for field_id, values in data.get("record_values", {}).items()
+        }
+        return cls.model_construct(**fields)
+
     def get_activities(self) -> List["Activity"]:
         """Retrieves a list of activities associated with this record.
 
@@ -246,7 +324,7 @@ class Record(_KaleidoscopeBaseModel):
             If an exception occurs during the API request, it logs the error and returns an empty list.
         """
         try:
-            resp = self._client._get("/records/" + self.id + "/operations")
+            resp = self._client._get(f"/records/{self.id}/operations")
             return self._client.activities._create_activity_list(resp)
         except Exception as e:
             _logger.error(f"Error fetching activities with this record: {e}")
@@ -264,7 +342,7 @@ class Record(_KaleidoscopeBaseModel):
         """
         try:
             self._client._post(
-                "/records/" + self.id + "/values",
+                f"/records/{self.id}/values",
                 {"content": content, "field_id": field_id, "operation_id": activity_id},
             )
             return
@@ -296,32 +374,96 @@ class Record(_KaleidoscopeBaseModel):
         if not values:
             return None
 
-        # include key values in the activity data (record_id = None)
-        if activity_id is not None:
-            values = [
-                value
-                for value in values
-                if (value.operation_id == activity_id) or value.record_id is None
-            ]
+        value = self._latest_value(
+            field_id, values, activity_id, include_sub_record_values, sub_record_id
+        )
+        return value.content if value else None
 
-        if not include_sub_record_values:
-            # key values have None for the record_id
-            values = [
-                value
-                for value in values
-                if value.record_id == self.id or value.record_id is None
-            ]
+    def _latest_value(
+        self,
+        field_id: str,
+        values: List[RecordValue],
+        activity_id: Optional[str],
+        include_sub_record_values: Optional[bool],
+        sub_record_id: Optional[str],
+    ) -> RecordValue | None:
+        # long lists are narrowed through an index, and their lookups memoized
+        if len(values) < _INDEX_MIN_VALUES or (
+            not sub_record_id and activity_id is None
+        ):
+            return self._scan_latest(
+                values, activity_id, include_sub_record_values, sub_record_id
+            )
 
-        if sub_record_id:
-            values = [value for value in values if value.record_id == sub_record_id]
+        index = self._values_index.get(field_id)
+        if index is None or not index.is_current(values):
+            index = _ValuesIndex(values)
+            self._values_index[field_id] = index
+
+        key = (activity_id, include_sub_record_values, sub_record_id)
+        if key not in index.latest:
+            index.latest[key] = self._scan_latest(
+                index.candidates(activity_id, sub_record_id),
+                activity_id,
+                include_sub_record_values,
+                sub_record_id,
+            )
+        return index.latest[key]
 
-        sorted_values: List[RecordValue] = sorted(
-            values,
-            key=lambda x: x.created_at if x.created_at else datetime.min,
-            reverse=True,
-        )
-        value = next(iter(sorted_values), None)
-        return value.content if value else None
+    def _scan_latest(
+        self,
+        values: List[RecordValue],
+        activity_id: Optional[str],
+        include_sub_record_values: Optional[bool],
+        sub_record_id: Optional[str],
+    ) -> RecordValue | None:
+        # a single pass that keeps the most recent matching value; values without
+        # a timestamp rank as the oldest, and on equal timestamps the earliest
+        # value in the list wins
+        record_id = self.id
+        by_activity = activity_id is not None
+        own_values_only = not include_sub_record_values
+        latest = None
+        latest_at = None
+        for value in values:
+            value_record_id = value.record_id
+            if sub_record_id and value_record_id != sub_record_id:
+                continue
+            # key values have None for the record_id; they belong to the record
+            # and to every activity
+            if value_record_id is not None:
+                if own_values_only and value_record_id != record_id:
+                    continue
+                if by_activity and value.operation_id != activity_id:
+                    continue
+
+            created_at = value.created_at
+            if latest is None or (
+                created_at is not None
+                and (latest_at is None or created_at > latest_at)
+            ):
+                latest = value
+                latest_at = created_at
+
+        return latest
+
+    def _collect_latest_by_field(
+        self,
+        activity_id: Optional[str] = None,
+        include_sub_record_values: Optional[bool] = False,
+        sub_record_id: Optional[str] = None,
+    ) -> dict[str, Any]:
+        # the content of the latest matching value of every field, in one walk
+        # over the record values
+        data = {}
+        for field_id, values in self.record_values.items():
+            value = self._latest_value(
+                field_id, values, activity_id, include_sub_record_values, sub_record_id
+            )
+            if value is not None:
+                data[field_id] = value.content
+
+        return data
 
     def get_activity_data(self, activity_id: str) -> dict:
         """Retrieves activity data for a specific activity ID.
@@ -333,13 +475,11 @@ class Record(_KaleidoscopeBaseModel):
             dict: A dictionary mapping field IDs to their corresponding values for the given activity.
                   Only fields with non-None values are included.
         """
-        data = {}
-        for field_id in self.record_values.keys():
-            result = self.get_value_content(field_id, activity_id)
-            if result is not None:
-                data[field_id] = result
-
-        return data
+        return {
+            field_id: content
+            for field_id, content in self._collect_latest_by_field(activity_id).items()
+            if content is not None
+        }
 
     def update_field(
         self, field_id: str, value: Any, activity_id: str | None
@@ -357,7 +497,7 @@ class Record(_KaleidoscopeBaseModel):
         try:
             body = {"field_id": field_id, "content": value, "operation_id": activity_id}
 
-            resp = self._client._post("/records/" + self.id + "/values", body)
+            resp = self._client._post(f"/records/{self.id}/values", body)
 
             if resp is None or len(resp) == 0:
                 return None
@@ -396,7 +536,7 @@ class Record(_KaleidoscopeBaseModel):
                 body["operation_id"] = activity_id
 
             resp = self._client._post_file(
-                "/records/" + self.id + "/values/file",
+                f"/records/{self.id}/values/file",
                 (file_name, file_data, file_type),
                 body,
             )
@@ -425,15 +565,19 @@ class Record(_KaleidoscopeBaseModel):
         """
 
         try:
-            resp = self._client._get("/records/" + self.id + "/values")
+            resp = self._client._get(f"/records/{self.id}/values")
             if resp is None:
                 return []
-            return resp
+            return [RecordValue.model_validate(value) for value in resp]
         except Exception as e:
             _logger.error(f"Error fetching values for this record: {e}")
             return []
 
 
+# built on first use rather than when the module is imported
+_RECORD_LIST_ADAPTER = TypeAdapter(List[Record], config=ConfigDict(defer_build=True))
+
+
 class RecordsService:
     """Service class for managing records in Kaleidoscope.
 
@@ -451,33 +595,46 @@ class RecordsService:
     def __init__(self, client: KaleidoscopeClient):
         self._client = client
 
-    def _create_record(self, data: dict) -> Record:
+    def _create_record(self, data: dict, validate: bool = True) -> Record:
         """Creates a new Record instance from the provided data.
 
-        Validates the input data using the Record model, sets the client for the record,
+        Builds the Record from the input data, sets the client for the record,
         and returns the resulting Record object.
 
         Args:
-            data (dict): The data to be validated and used for creating the Record.
+            data (dict): The data used for creating the Record.
+            validate (bool): Whether to validate the data with the Record model. Pass
+                False only for trusted API responses, which are then built without
+                validation; only the timestamps are parsed. Defaults to True.
 
         Returns:
-            Record: The validated and initialized Record instance.
+            Record: The initialized Record instance.
+
+        Raises:
+            ValidationError: If `validate` is True and the data is not a valid Record.
         """
-        record = Record.model_validate(data)
+        record = Record.model_validate(data) if validate else Record._from_trusted(data)
         record._set_client(self._client)
 
         return record
 
-    def _create_record_list(self, data: list[dict]) -> List[Record]:
+    def _create_record_list(
+        self, data: list[dict], validate: bool = True
+    ) -> List[Record]:
         """Converts a dictionary of data into a list of Record objects and sets the client for each record.
 
         Args:
             data (list[dict]): The input data to be converted into Record objects.
+            validate (bool): Whether to validate the data. See `_create_record`.
+                Defaults to True.
 
         Returns:
             List[Record]: A list of Record objects with the client set.
         """
-        records = TypeAdapter(List[Record]).validate_python(data)
+        if validate:
+            records = _RECORD_LIST_ADAPTER.validate_python(data)
+        else:
+            records = [Record._from_trusted(d) for d in data]
         for record in records:
             record._set_client(self._client)
 
@@ -493,38 +650,65 @@ class RecordsService:
             (Record | None): The record object if found, otherwise None.
         """
         try:
-            resp = self._client._get("/records/" + record_id)
+            resp = self._client._get(f"/records/{record_id}")
             if resp is None:
                 return None
 
             return self._create_record(resp)
         except Exception as e:
-            _logger.error(f"Error fetching record {id}: {e}")
+            _logger.error(f"Error fetching record {record_id}: {e}")
             return None
 
     def get_records_by_ids(
-        self, record_ids: List[str], batch_size: int = 250
+        self,
+        record_ids: List[str],
+        batch_size: int = 250,
+        max_concurrency: int = 8,
+        validate: bool = True,
     ) -> List[Record]:
         """Retrieves records corresponding to the provided list of record IDs in batches.
 
+        Batches are requested concurrently, so fetching many IDs costs roughly one
+        round-trip rather than one per batch.
+
         Args:
             record_ids (List[str]): A list of record IDs to retrieve.
             batch_size (int, optional): The number of record IDs to process per batch. Defaults to 250.
+            max_concurrency (int, optional): The maximum number of batch requests in
+                flight at once. Defaults to 8.
+            validate (bool, optional): Whether to validate the responses. Passing False
+                skips Pydantic validation, which is considerably faster for large
+                batches; timestamps are still parsed, but other fields are not
+                coerced. Defaults to True.
 
         Returns:
-            List[Record]: A list of Record objects corresponding to the provided IDs.
+            List[Record]: A list of Record objects corresponding to the provided IDs,
+                in the order of the batches requested.
 
         Note:
             If an exception occurs during the API request, it logs the error and returns an empty list.
         """
         try:
-            all_records = []
+            # the client URL-encodes the query, so ids need no escaping here
+            batch_params = [
+                {"record_ids": ",".join(record_ids[i : i + batch_size])}
+                for i in range(0, len(record_ids), batch_size)
+            ]
+
+            def get_batch(params: dict[str, str]) -> Any:
+                return self._client._get("/records", params)
 
-            for i in range(0, len(record_ids), batch_size):
-                batch = record_ids[i : i + batch_size]
-                resp = self._client._get(f"/records?record_ids={",".join(batch)}")
-                records = self._create_record_list(resp)
-                all_records.extend(records)
+            if len(batch_params) > 1 and max_concurrency > 1:
+                with ThreadPoolExecutor(
+                    max_workers=min(max_concurrency, len(batch_params))
+                ) as executor:
+                    responses = list(executor.map(get_batch, batch_params))
+            else:
+                responses = [get_batch(params) for params in batch_params]
+
+            all_records = []
+            for resp in responses:
+                all_records.extend(self._create_record_list(resp, validate=validate))
 
             return all_records
         except Exception as e:
@@ -539,11 +723,15 @@ class RecordsService:
 
         Returns:
             (Record | None): The matching Record object if found, otherwise None.
+                Returns None without a request if `key_values` is empty.
         """
+        if not key_values:
+            return None
+
         try:
             resp = self._client._get(
                 "/records/identifiers",
-                {"records_key_field_to_value": json.dumps([key_values])},
+                {"records_key_field_to_value": _json_dumps([key_values]).decode()},
             )
             if resp is None or len(resp) == 0:
                 return None
@@ -564,7 +752,11 @@ class RecordsService:
 
         Returns:
             (Record | None): The retrieved or newly created Record object if successful or None, if no record is found or created
+                Returns None without a request if `key_values` is empty.
         """
+        if not key_values:
+            return None
+
         try:
             resp = self._client._post(
                 "/records",
@@ -624,7 +816,7 @@ class RecordsService:
         """
         try:
             client_params = {
-                key: (value if isinstance(value, str) else json.dumps(value))
+                key: (value if isinstance(value, str) else _json_dumps(value).decode())
                 for key, value in params.items()
             }
             resp = self._client._get("/records/search", client_params)
@@ -667,7 +859,7 @@ class RecordsService:
                 body["operation_id"] = activity_id
 
             resp = self._client._post_file(
-                "/records/" + record_id + "/values/file",
+                f"/records/{record_id}/values/file",
                 (file_name, file_data, file_type),
                 body,
             )
@@ -19,13 +19,13 @@ Classes:
 
 """
 
-import json
+import functools
 import os
-from typing import Any, Final
+from typing import Any
 import pytest
 
 from pytest_mock import MockerFixture
-from kalpy.client import KaleidoscopeClient
+from kalpy.client import KaleidoscopeClient, _json_loads
 
 # Params for using the api to create an experiment in Kaleidoscope using the client
 # These are only used for test fixture initialization and are mocked out during actual tests
@@ -51,47 +51,49 @@ def kal_client_mock(mocker: MockerFixture):
         _KALEIDOSCOPE_API_CLIENT_ID, _KALEIDOSCOPE_API_CLIENT_SECRET, _API_URL
     )
 
-    mocker.patch.object(
-        client, "_post", side_effect=NotImplementedError("KaleidoscopeClient._post")
-    )
-    mocker.patch.object(
-        client,
-        "_post_file",
-        side_effect=NotImplementedError("KaleidoscopeClient._post_file"),
-    )
-    mocker.patch.object(
-        client, "_put", side_effect=NotImplementedError("KaleidoscopeClient._put")
-    )
-    mocker.patch.object(
-        client, "_get", side_effect=NotImplementedError("KaleidoscopeClient._get")
-    )
-    mocker.patch.object(
+    methods = mocker.patch.multiple(
         client,
-        "_get_file",
-        side_effect=NotImplementedError("KaleidoscopeClient._get_file"),
+        _post=mocker.DEFAULT,
+        _post_file=mocker.DEFAULT,
+        _put=mocker.DEFAULT,
+        _get=mocker.DEFAULT,
+        _get_file=mocker.DEFAULT,
     )
+    for name, method in methods.items():
+        method.side_effect = NotImplementedError(f"KaleidoscopeClient.{name}")
 
     yield client
 
 
-_data_cache: dict[str, Any] = {}
+@functools.cache
+def _read_data(file_name: str) -> bytes:
+    with open(f"tests/responses/{file_name}.json", "rb") as f:
+        return f.read()
 
 
 def _load_data(file_name: str) -> Any:
-    if file_name in _data_cache:
-        return _data_cache[file_name].copy()
+    # decoded on every call so each test gets its own copy; the client's JSON
+    # decoder uses msgspec or orjson if installed
+    data = _json_loads(_read_data(file_name))
+
+    if isinstance(data, list):
+        if len(data) < 2:
+            raise ValueError(
+                f"Number of data items less than two: data has {len(data)} it"
+            )
+
+    return data
+
 
-    with open(f"tests/responses/{file_name}.json", encoding="utf-8") as f:
-        data = json.load(f)
-        _data_cache[file_name] = data
+class _Dataset[T]:
+    """A `_MockData` attribute whose JSON file is read on first access and decoded
+    on every access."""
 
-        if isinstance(data, list):
-            if len(data) < 2:
-                raise ValueError(
-                    f"Number of data items less than two: data has {len(data)} it"
-                )
+    def __init__(self, file_name: str):
+        self._file_name = file_name
 
-        return data.copy()
+    def __get__(self, instance: Any, owner: type) -> T:
+        return _load_data(self._file_name)
 
 
 # @dataclass(frozen=True)
@@ -100,7 +102,9 @@ class _MockData:
     A container class for mock data used in testing.
 
     This class provides static mock data loaded from JSON files for various entities
-    in the application. All attributes are class-level constants loaded at module import time.
+    in the application. Each file is read once per test session, the first time its
+    attribute is accessed, and decoded on every access, so each access returns a
+    fresh copy that a test may modify.
 
     Attributes:
         EXPERIMENTS (list[dict]): Mock data for experiments.
@@ -117,13 +121,13 @@ class _MockData:
             as BytesIO, and MIME type for testing file uploads.
     """
 
-    EXPERIMENTS: Final[list[dict]] = _load_data("experiments")
-    EXPERIMENT_TYPES: Final[list[dict]] = _load_data("experiment_types")
-    RECORDS: Final[list[dict]] = _load_data("records")
-    RECORD_VALUES_DRUG_1: Final[list[dict]] = _load_data("record_values_drug_1")
-    TASKS: Final[list[dict]] = _load_data("tasks")
-    RECORD_VIEWS: Final[list[dict]] = _load_data("record_views")
-    ENTITY_TYPES: Final[list[dict]] = _load_data("entity_types")
-    KEY_FIELDS: Final[list[dict]] = _load_data("key_fields")
-    DATA_FIELDS: Final[list[dict]] = _load_data("data_fields")
-    PROGRAMS: Final[list[dict]] = _load_data("programs")
+    EXPERIMENTS = _Dataset[list[dict]]("experiments")
+    EXPERIMENT_TYPES = _Dataset[list[dict]]("experiment_types")
+    RECORDS = _Dataset[list[dict]]("records")
+    RECORD_VALUES_DRUG_1 = _Dataset[list[dict]]("record_values_drug_1")
+    TASKS = _Dataset[list[dict]]("tasks")
+    RECORD_VIEWS = _Dataset[list[dict]]("record_views")
+    ENTITY_TYPES = _Dataset[list[dict]]("entity_types")
+    KEY_FIELDS = _Dataset[list[dict]]("key_fields")
+    DATA_FIELDS = _Dataset[list[dict]]("data_fields")
+    PROGRAMS = _Dataset[list[dict]]("programs")
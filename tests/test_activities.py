@@ -5,9 +5,9 @@ Test Coverage:
     - Activity.update(): Validates proper API calls and parameter updates
     - Activity.add_records(): Tests adding records to activities
     - Activity.get_record_data(): Tests retrieval of record data from activities
-    - ActivitiesService._create_activity(): Tests client injection
+    - ActivitiesService._create_activity(): Tests client injection for both activity types
     - ActivitiesService._create_activity_list(): Tests batch client injection
-    - ActivitiesService.get_activities(): Tests retrieval of all activities
+    - ActivitiesService.get_activities(): Tests retrieval of all activities and caching
     - ActivitiesService.get_activity_by_id(): Tests retrieval by ID with None fallback
     - ActivitiesService.get_activities_by_ids(): Tests batch retrieval with pagination
     - ActivitiesService.get_definitions(): Tests retrieval of activity definitions
@@ -23,12 +23,19 @@ Fixtures:
     - `activity_experiment`: Provides a pre-configured Activity instance (experiment type) with mocked client
 """
 
+import threading
+
 import pytest
 from pydantic import ValidationError
 from pytest_mock import MockerFixture
 
 from kalpy.client import KaleidoscopeClient
-from kalpy.activities import Activity, ActivityStatusEnum
+from kalpy.activities import (
+    ActivitiesService,
+    Activity,
+    ActivityStatusEnum,
+    Property,
+)
 from tests.conftest import _MockData
 
 
@@ -82,6 +89,29 @@ def test_activity_update(
     assert activity_task.status == new_status
 
 
+def test_activity_update_ignores_unknown_keys(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient, activity_task: Activity
+):
+    """
+    Test that Activity.update():
+    - Copies only model fields from the response onto the activity
+    """
+    updated_data = {
+        "id": activity_task.id,
+        "title": "Renamed",
+        "records": "not a field",
+        "unknown_key": 1,
+    }
+
+    mocker.patch.object(kal_client_mock, "_put", return_value=updated_data)
+
+    activity_task.update(title="Renamed")
+
+    assert activity_task.title == "Renamed"
+    assert "records" not in activity_task.__dict__
+    assert not hasattr(activity_task, "unknown_key")
+
+
 def test_activity_add_records(
     mocker: MockerFixture,
     kal_client_mock: KaleidoscopeClient,
@@ -113,7 +143,7 @@ def test_activity_get_record_data(
     - Calls get_activity_data for each record
     """
     # Mock the records property
-    mock_record = mocker.MagicMock()
+    mock_record = mocker.Mock(spec=["get_activity_data"])
     mock_record.get_activity_data.return_value = {"some": "data"}
 
     mocker.patch.object(
@@ -130,21 +160,55 @@ def test_activity_get_record_data(
     assert result[0] == {"some": "data"}
 
 
+def test_activity_get_record(
+    mocker: MockerFixture,
+    activity_experiment: Activity,
+):
+    """
+    Test that Activity.get_record() and Activity.has_record():
+    - Find records by their record identifier
+    - Return None / False for identifiers not in the activity
+    """
+    first = mocker.Mock(spec=["record_identifier"], record_identifier="rec-a")
+    second = mocker.Mock(spec=["record_identifier"], record_identifier="rec-b")
+    duplicate = mocker.Mock(spec=["record_identifier"], record_identifier="rec-a")
+
+    mocker.patch.object(
+        Activity,
+        "records",
+        new_callable=mocker.PropertyMock,
+        return_value=[first, second, duplicate],
+    )
+
+    assert activity_experiment.get_record("rec-b") is second
+    assert activity_experiment.get_record("rec-a") is first
+    assert activity_experiment.has_record("rec-a")
+    assert activity_experiment.get_record("rec-missing") is None
+    assert not activity_experiment.has_record("rec-missing")
+
+
 # ==================== ActivitiesService Methods ====================
 
 
-def test_create_activity(kal_client_mock: KaleidoscopeClient):
+@pytest.mark.parametrize("activity_type", ["task", "experiment"])
+def test_create_activity(kal_client_mock: KaleidoscopeClient, activity_type: str):
     """
     Test that ActivitiesService._create_activity():
+    - Creates task-type and experiment-type activities with the same Activity model
     - Injects client (KaleidoscopeClient) into activity object
     """
-    activity_data = _MockData.TASKS[0]
+    activity_data = next(
+        a
+        for a in [*_MockData.TASKS, *_MockData.EXPERIMENTS]
+        if a["activity_type"] == activity_type
+    )
 
     result = kal_client_mock.activities._create_activity(activity_data)
 
     assert isinstance(result, Activity)
     assert result._client is kal_client_mock
     assert result.id == activity_data["id"]
+    assert result.activity_type == activity_type
 
 
 def test_create_activity_validation_error(kal_client_mock: KaleidoscopeClient):
@@ -214,6 +278,247 @@ def test_get_activities(mocker: MockerFixture, kal_client_mock: KaleidoscopeClie
     assert len(result) == len(activities_data)
 
 
+def test_get_activities_is_cached(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that ActivitiesService.get_activities():
+    - Reuses the cached result on repeated calls
+    - Fetches again after clear_cache()
+    """
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=_MockData.TASKS
+    )
+
+    first = kal_client_mock.activities.get_activities()
+    second = kal_client_mock.activities.get_activities()
+
+    assert first is second
+    mock_get.assert_called_once_with("/activities")
+
+    kal_client_mock.activities.clear_cache()
+    kal_client_mock.activities.get_activities()
+
+    assert mock_get.call_count == 2
+
+
+def test_get_activities_cache_expires(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that ActivitiesService.get_activities():
+    - Fetches again once the cached result is older than cache_ttl
+    """
+    service = ActivitiesService(kal_client_mock, cache_ttl=60)
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=_MockData.TASKS
+    )
+    mock_monotonic = mocker.patch("kalpy.activities.time.monotonic", return_value=0)
+
+    service.get_activities()
+    mock_monotonic.return_value = 59
+    service.get_activities()
+    assert mock_get.call_count == 1
+
+    mock_monotonic.return_value = 61
+    service.get_activities()
+    assert mock_get.call_count == 2
+
+
+def test_get_activities_without_validation(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that ActivitiesService.get_activities(validate=False):
+    - Returns Activity objects built without validation
+    - Sets the client on each activity and on its properties
+    """
+    activities_data = _MockData.TASKS
+
+    mocker.patch.object(kal_client_mock, "_get", return_value=activities_data)
+
+    result = kal_client_mock.activities.get_activities(validate=False)
+
+    assert [activity.id for activity in result] == [a["id"] for a in activities_data]
+    for activity in result:
+        assert activity._client is kal_client_mock
+        for prop in activity.properties:
+            assert isinstance(prop, Property)
+            assert prop._client is kal_client_mock
+
+
+def test_prefetch_relations(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that ActivitiesService.prefetch_relations():
+    - Fetches each related collection once for all activities
+    - Populates the cached relation properties of every activity
+    """
+    activities = kal_client_mock.activities._create_activity_list(
+        [_MockData.TASKS[0], _MockData.EXPERIMENTS[0]]
+    )
+    activities[0].assigned_user_ids = ["user-2", "user-1"]
+    activities[1].assigned_user_ids = ["user-3"]
+    activities[0].program_ids = [_MockData.PROGRAMS[0]["id"]]
+    activities[1].program_ids = []
+
+    users = [mocker.Mock(spec=["id"], id=f"user-{i}") for i in (1, 2, 3)]
+    mock_members = mocker.patch.object(
+        kal_client_mock.workspace, "get_members", return_value=users
+    )
+    mock_groups = mocker.patch.object(
+        kal_client_mock.workspace, "get_groups", return_value=[]
+    )
+    mock_labels = mocker.patch.object(
+        kal_client_mock.labels, "get_labels", return_value=[]
+    )
+    mock_programs = mocker.patch.object(
+        kal_client_mock.programs,
+        "get_programs",
+        return_value=[
+            mocker.Mock(spec=["id"], id=program["id"])
+            for program in _MockData.PROGRAMS
+        ],
+    )
+
+    kal_client_mock.activities.prefetch_relations(activities)
+
+    for mock in (mock_members, mock_groups, mock_labels, mock_programs):
+        mock.assert_called_once_with()
+
+    # ordering follows the workspace listing, as with get_members_by_ids
+    assert activities[0].assigned_users == users[:2]
+    assert activities[1].assigned_users == users[2:]
+    assert [p.id for p in activities[0].programs] == [_MockData.PROGRAMS[0]["id"]]
+    assert activities[1].programs == []
+    assert activities[0].labels == [] and activities[0].assigned_groups == []
+
+
+def test_prefetch_children_and_records(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that Activity.prefetch_children_and_records():
+    - Requests the child activities and the records of the activity
+    - Populates both cached properties without further requests
+    """
+    activity = kal_client_mock.activities._create_activity(_MockData.EXPERIMENTS[0])
+    responses = {
+        f"/activities/{activity.id}/activities": [_MockData.TASKS[0]],
+        f"/operations/{activity.id}/records": _MockData.RECORDS[:2],
+    }
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", side_effect=lambda url: responses[url]
+    )
+
+    activity.prefetch_children_and_records()
+
+    assert mock_get.call_count == 2
+    assert [a.id for a in activity.child_activities] == [_MockData.TASKS[0]["id"]]
+    assert [r.id for r in activity.records] == [r["id"] for r in _MockData.RECORDS[:2]]
+    assert mock_get.call_count == 2
+
+
+def test_prefetch_children_and_records_in_request_scope(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that Activity.prefetch_children_and_records():
+    - Shares the responses of the calling thread's request_scope, including the
+      request it makes on the prefetch pool
+    """
+    activity_id = _MockData.EXPERIMENTS[0]["id"]
+    responses = {
+        f"/activities/{activity_id}/activities": [_MockData.TASKS[0]],
+        f"/operations/{activity_id}/records": _MockData.RECORDS[:2],
+    }
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", side_effect=lambda url: responses[url]
+    )
+
+    with kal_client_mock.request_scope():
+        for _ in range(2):
+            activity = kal_client_mock.activities._create_activity(
+                _MockData.EXPERIMENTS[0]
+            )
+            activity.prefetch_children_and_records()
+
+    assert sorted(call.args[0] for call in mock_get.call_args_list) == sorted(responses)
+    assert [r.id for r in activity.records] == [r["id"] for r in _MockData.RECORDS[:2]]
+
+
+def test_request_scope_shares_child_activity_requests(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that KaleidoscopeClient.request_scope():
+    - Requests a URL once for separate objects inside the scope
+    - Requests it again after the scope exits
+    """
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=[_MockData.TASKS[0]]
+    )
+
+    def load_children():
+        activity = kal_client_mock.activities._create_activity(_MockData.EXPERIMENTS[0])
+        return activity.child_activities
+
+    with kal_client_mock.request_scope():
+        first = load_children()
+        second = load_children()
+
+    assert mock_get.call_count == 1
+    assert [a.id for a in first] == [a.id for a in second]
+
+    load_children()
+    assert mock_get.call_count == 2
+
+
+def test_request_scope_is_per_thread(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that KaleidoscopeClient.request_scope():
+    - Keeps the responses of concurrent scopes on different threads separate
+    - Keeps a scope's responses when a scope on another thread exits
+    """
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=[_MockData.TASKS[0]]
+    )
+    both_loaded = threading.Barrier(2)
+    first_exited = threading.Event()
+
+    def load_children():
+        activity = kal_client_mock.activities._create_activity(_MockData.EXPERIMENTS[0])
+        return activity.child_activities
+
+    def first():
+        with kal_client_mock.request_scope():
+            load_children()
+            both_loaded.wait()
+        first_exited.set()
+
+    def second():
+        with kal_client_mock.request_scope():
+            load_children()
+            both_loaded.wait()
+            first_exited.wait()
+            calls_before = mock_get.call_count
+            load_children()
+            refetched.append(mock_get.call_count > calls_before)
+
+    refetched = []
+    threads = [threading.Thread(target=first), threading.Thread(target=second)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert mock_get.call_count == 2
+    assert refetched == [False]
+
+
 def test_get_activity_by_id(mocker: MockerFixture, kal_client_mock: KaleidoscopeClient):
     """
     Test that ActivitiesService.get_activity_by_id():
@@ -246,6 +551,30 @@ def test_get_activity_by_id_returns_none_when_not_found(
     assert result is None
 
 
+def test_get_activity_by_external_id(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that ActivitiesService.get_activity_by_external_id():
+    - Searches the activities, not the activity definitions
+    - Reuses one fetch of the activities for repeated lookups
+    """
+    tasks = [
+        {**_MockData.TASKS[0], "external_id": "ext-1"},
+        {**_MockData.TASKS[1], "external_id": "ext-2"},
+    ]
+    mock_get = mocker.patch.object(kal_client_mock, "_get", return_value=tasks)
+
+    first = kal_client_mock.activities.get_activity_by_external_id("ext-1")
+    second = kal_client_mock.activities.get_activity_by_external_id("ext-2")
+    missing = kal_client_mock.activities.get_activity_by_external_id("ext-3")
+
+    mock_get.assert_called_once_with("/activities")
+    assert isinstance(first, Activity) and first.id == tasks[0]["id"]
+    assert second is not None and second.id == tasks[1]["id"]
+    assert missing is None
+
+
 def test_get_activities_by_ids(
     mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
 ):
@@ -264,14 +593,29 @@ def test_get_activities_by_ids(
     result = kal_client_mock.activities.get_activities_by_ids(target_ids)
 
     # Verify the call was made with the correct format
-    expected_url = f"/activities?activity_ids={",".join(target_ids)}"
-    mock_get.assert_called_once_with(expected_url)
+    mock_get.assert_called_once_with(
+        "/activities", {"activity_ids": ",".join(target_ids)}
+    )
 
     assert isinstance(result, list)
     assert len(result) == len(activities_data)
     assert all(isinstance(activity, Activity) for activity in result)
 
 
+def test_get_activities_by_ids_encodes_ids(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that ActivitiesService.get_activities_by_ids():
+    - Passes the IDs unescaped as query params, for the client to URL-encode
+    """
+    mock_get = mocker.patch.object(kal_client_mock, "_get", return_value=[])
+
+    kal_client_mock.activities.get_activities_by_ids(["a&b", "c d"])
+
+    mock_get.assert_called_once_with("/activities", {"activity_ids": "a&b,c d"})
+
+
 def test_get_activities_by_ids_with_batching(
     mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
 ):
@@ -300,6 +644,32 @@ def test_get_activities_by_ids_with_batching(
     assert len(result) == 3
 
 
+def test_get_activities_by_ids_concurrent_preserves_batch_order(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that ActivitiesService.get_activities_by_ids():
+    - Requests every batch when batches are fetched concurrently
+    - Returns activities in batch order regardless of completion order
+    """
+    activities_data = _MockData.TASKS[:3]
+    target_ids = [act["id"] for act in activities_data]
+    responses = {act["id"]: [act] for act in activities_data}
+
+    mock_get = mocker.patch.object(
+        kal_client_mock,
+        "_get",
+        side_effect=lambda url, params: responses[params["activity_ids"]],
+    )
+
+    result = kal_client_mock.activities.get_activities_by_ids(
+        target_ids, batch_size=1, max_concurrency=3
+    )
+
+    assert mock_get.call_count == 3
+    assert [activity.id for activity in result] == target_ids
+
+
 def test_get_definitions(mocker: MockerFixture, kal_client_mock: KaleidoscopeClient):
     """
     Test that ActivitiesService.get_definitions():
@@ -319,72 +689,62 @@ def test_get_definitions(mocker: MockerFixture, kal_client_mock: KaleidoscopeCli
     assert len(result) == len(definitions_data)
 
 
-def test_get_definition_by_name(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
-):
-    """
-    Test that ActivitiesService.get_definition_by_name():
-    - Finds the activity definition with the corresponding name
-    """
-    definitions_data = _MockData.EXPERIMENT_TYPES
-    target_name = definitions_data[0]["title"]
-
-    mocker.patch.object(kal_client_mock, "_get", return_value=definitions_data)
-
-    result = kal_client_mock.activities.get_definition_by_name(target_name)
-
-    assert result is not None
-    assert result.title == target_name
-
-
-def test_get_definition_by_name_returns_none_when_not_found(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
-):
-    """
-    Test that ActivitiesService.get_definition_by_name():
-    - Returns None when definition with name is not found
-    """
-    definitions_data = _MockData.EXPERIMENT_TYPES
-
-    mocker.patch.object(kal_client_mock, "_get", return_value=definitions_data)
-
-    result = kal_client_mock.activities.get_definition_by_name("NonexistentName")
-
-    assert result is None
-
-
-def test_get_definition_by_id(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+@pytest.mark.parametrize(
+    "method, key, found",
+    [
+        ("get_definition_by_name", "title", True),
+        ("get_definition_by_name", "NonexistentName", False),
+        ("get_definition_by_id", "id", True),
+        ("get_definition_by_id", "nonexistent-id", False),
+    ],
+)
+def test_get_definition_by(
+    mocker: MockerFixture,
+    kal_client_mock: KaleidoscopeClient,
+    method: str,
+    key: str,
+    found: bool,
 ):
     """
-    Test that ActivitiesService.get_definition_by_id():
-    - Finds the activity definition with the corresponding ID
+    Test that ActivitiesService.get_definition_by_name() and get_definition_by_id():
+    - Find the activity definition with the corresponding name or ID
+    - Return None when no definition matches
     """
     definitions_data = _MockData.EXPERIMENT_TYPES
-    target_id = definitions_data[0]["id"]
+    target = definitions_data[0][key] if found else key
 
     mocker.patch.object(kal_client_mock, "_get", return_value=definitions_data)
 
-    result = kal_client_mock.activities.get_definition_by_id(target_id)
+    result = getattr(kal_client_mock.activities, method)(target)
 
-    assert result is not None
-    assert result.id == target_id
+    if found:
+        assert result is not None
+        assert getattr(result, key) == target
+    else:
+        assert result is None
 
 
-def test_get_definition_by_id_returns_none_when_not_found(
+def test_get_definition_lookups_share_one_fetch(
     mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
 ):
     """
-    Test that ActivitiesService.get_definition_by_id():
-    - Returns None when definition with ID is not found
+    Test that the ActivitiesService.get_definition_by_* lookups:
+    - Resolve by id and name from the cached definitions
+    - Fetch the definitions only once
     """
     definitions_data = _MockData.EXPERIMENT_TYPES
+    target = definitions_data[-1]
 
-    mocker.patch.object(kal_client_mock, "_get", return_value=definitions_data)
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=definitions_data
+    )
 
-    result = kal_client_mock.activities.get_definition_by_id("nonexistent-id")
+    by_id = kal_client_mock.activities.get_definition_by_id(target["id"])
+    by_name = kal_client_mock.activities.get_definition_by_name(target["title"])
 
-    assert result is None
+    assert by_id is not None and by_id.id == target["id"]
+    assert by_name is by_id
+    mock_get.assert_called_once_with("/activity_definitions")
 
 
 def test_get_activities_with_record(
@@ -415,27 +775,6 @@ def test_get_activities_with_record(
     assert all(target_record_id in activity.all_record_ids for activity in result)
 
 
-def test_activity_task_type_distinction(kal_client_mock: KaleidoscopeClient):
-    """
-    Test that both task and experiemnt activity types are properly handled:
-    - Validates that task-type activities can be created
-    - Validates that experiment-type activities can be created
-    - Ensures both types follow the same Activity model
-    """
-    # Test task type
-    task_data = next(t for t in _MockData.TASKS if t["activity_type"] == "task")
-    task_activity = kal_client_mock.activities._create_activity(task_data)
-    assert task_activity.activity_type == "task"
-    assert isinstance(task_activity, Activity)
-
-    # Test experiment type
-    experiment_data = _MockData.EXPERIMENTS[0]
-    experiment_activity = kal_client_mock.activities._create_activity(experiment_data)
-    assert experiment_activity.activity_type == "experiment"
-    assert isinstance(experiment_activity, Activity)
-    assert hasattr(experiment_activity, "all_record_ids")
-
-
 def test_activity_with_properties(kal_client_mock: KaleidoscopeClient):
     """
     Test that Activity with properties:
@@ -0,0 +1,124 @@
+"""
+Unit tests for the AsyncKaleidoscopeClient class in the Kaleidoscope client.
+This module tests that the asynchronous wrapper forwards calls to the synchronous
+client and that independent calls can be awaited together.
+Test Coverage:
+    - test_run: Validates that calls are forwarded to the client
+    - test_run_bounds_concurrency: Validates that max_concurrency bounds the calls
+    - test_get_or_create_data_fields_gathered: Validates concurrent field creation
+    - test_close_leaves_client_open: Validates that only an owned client is closed
+"""
+
+import asyncio
+import threading
+import time
+
+from pytest_mock import MockerFixture
+
+from kalpy.async_client import AsyncKaleidoscopeClient
+from kalpy.client import KaleidoscopeClient
+from kalpy.entity_fields import DataFieldTypeEnum, EntityField
+from tests.conftest import _MockData
+
+
+def test_run(mocker: MockerFixture, kal_client_mock: KaleidoscopeClient):
+    """
+    Test that AsyncKaleidoscopeClient.run():
+    - Calls the given method with the same arguments
+    - Returns its response
+    """
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=_MockData.KEY_FIELDS
+    )
+
+    async def main():
+        async with AsyncKaleidoscopeClient(kal_client_mock) as aclient:
+            return await aclient.run(kal_client_mock._get, "/key_fields", params=None)
+
+    result = asyncio.run(main())
+
+    mock_get.assert_called_once_with("/key_fields", params=None)
+    assert result == _MockData.KEY_FIELDS
+
+
+def test_run_bounds_concurrency(kal_client_mock: KaleidoscopeClient):
+    """
+    Test that AsyncKaleidoscopeClient.run():
+    - Runs up to max_concurrency calls at once, and no more
+    """
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def call():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+
+    async def main():
+        async with AsyncKaleidoscopeClient(
+            kal_client_mock, max_concurrency=3
+        ) as aclient:
+            await asyncio.gather(*(aclient.run(call) for _ in range(9)))
+
+    asyncio.run(main())
+
+    assert peak == 3
+
+
+def test_get_or_create_data_fields_gathered(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that AsyncKaleidoscopeClient.get_or_create_data_field():
+    - Can be gathered for many fields at once
+    - Returns the fields in the order they were requested
+    """
+    names = [f"Field{i}" for i in range(5)]
+
+    def post(url: str, data: dict) -> dict:
+        return {**_MockData.DATA_FIELDS[0], "field_name": data["field_name"]}
+
+    mock_post = mocker.patch.object(kal_client_mock, "_post", side_effect=post)
+
+    async def main():
+        async with AsyncKaleidoscopeClient(
+            kal_client_mock, max_concurrency=2
+        ) as aclient:
+            return await asyncio.gather(
+                *(
+                    aclient.get_or_create_data_field(name, DataFieldTypeEnum.TEXT)
+                    for name in names
+                )
+            )
+
+    result = asyncio.run(main())
+
+    assert mock_post.call_count == len(names)
+    assert all(isinstance(f, EntityField) for f in result)
+    assert [f.field_name for f in result] == names
+
+
+def test_close_leaves_client_open(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that AsyncKaleidoscopeClient.close():
+    - Leaves the client open unless owns_client is set
+    - Closes the client when owns_client is set
+    """
+    mock_close = mocker.patch.object(kal_client_mock, "close")
+
+    async def main(owns_client: bool):
+        async with AsyncKaleidoscopeClient(kal_client_mock, owns_client=owns_client):
+            pass
+
+    asyncio.run(main(owns_client=False))
+    mock_close.assert_not_called()
+
+    asyncio.run(main(owns_client=True))
+    mock_close.assert_called_once_with()
@@ -0,0 +1,227 @@
+"""
+Unit tests for the request handling of the KaleidoscopeClient.
+
+This module tests the client's HTTP layer against a local server, verifying that:
+- Client errors raise KaleidoscopeAPIError
+- Requests are not sent when the client cannot authenticate
+- Tokens are refreshed before they expire, however short-lived they are
+- Rate-limited requests are retried, including POST requests
+- POST requests are not retried on server errors or once they were sent
+- The httpx transport retries responses with the same policy
+- The httpx transport raises network failures as `requests` exceptions
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import socket
+import threading
+from typing import Any, Iterator
+
+import pytest
+from pytest_mock import MockerFixture
+import requests
+from urllib3.exceptions import ConnectTimeoutError, ReadTimeoutError
+
+from kalpy.client import (
+    KaleidoscopeAPIError,
+    KaleidoscopeAuthError,
+    KaleidoscopeClient,
+    _Retry,
+)
+
+
+class _Server(ThreadingHTTPServer):
+    """Serves tokens and replies to API requests with queued responses."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.responses: list[tuple[int, Any, dict[str, str]]] = []
+        self.token_status = 200
+        self.requests: list[tuple[str, str]] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _reply(self, status: int, body: Any, headers: dict[str, str]) -> None:
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _handle(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/auth/oauth/token":
+            token = {"access_token": "a", "refresh_token": "r", "expires_in": 3600}
+            self._reply(self.server.token_status, token, {})
+            return
+
+        self.server.requests.append((self.command, self.path))
+        self._reply(*self.server.responses.pop(0))
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server: _Server) -> Iterator[KaleidoscopeClient]:
+    client = KaleidoscopeClient("test-client-id", "test-client-secret", server.url)
+    yield client
+    client.close()
+
+
+def test_client_error_raises(server: _Server, client: KaleidoscopeClient):
+    server.responses = [(404, {"detail": "not found"}, {})]
+
+    with pytest.raises(KaleidoscopeAPIError) as exc_info:
+        client._get("/records/missing")
+
+    assert exc_info.value.method == "GET"
+    assert exc_info.value.status_code == 404
+    assert "not found" in exc_info.value.body
+    assert server.requests == [("GET", "/records/missing")]
+
+
+def test_auth_failure_raises(server: _Server, client: KaleidoscopeClient):
+    server.token_status = 401
+
+    with pytest.raises(KaleidoscopeAuthError) as exc_info:
+        client._get("/records")
+
+    assert exc_info.value.status_code == 401
+    assert server.requests == []
+
+
+@pytest.mark.parametrize("expires_in", [30, 600, 3600])
+def test_token_refresh_scheduled_before_expiry(
+    mocker: MockerFixture, expires_in: int
+):
+    client = KaleidoscopeClient("test-client-id", "test-client-secret")
+    mock_schedule = mocker.patch.object(client, "_schedule_refresh")
+    mocker.patch("kalpy.client.time.monotonic", return_value=0)
+
+    try:
+        client._update_tokens(
+            {"access_token": "a", "refresh_token": "r", "expires_in": expires_in}
+        )
+    finally:
+        client.close()
+
+    deadline = client._refresh_deadline
+    delay = mock_schedule.call_args.args[0]
+    assert expires_in / 2 <= deadline < expires_in
+    # refreshed once per token lifetime, not every second
+    assert expires_in / 4 <= delay < deadline
+
+
+@pytest.mark.parametrize("method", ["GET", "POST"])
+def test_rate_limited_request_retried(
+    server: _Server, client: KaleidoscopeClient, method: str
+):
+    server.responses = [
+        (429, {}, {"Retry-After": "0"}),
+        (200, {"ok": True}, {}),
+    ]
+
+    if method == "GET":
+        result = client._get("/records")
+    else:
+        result = client._post("/records", {})
+
+    assert result == {"ok": True}
+    assert server.requests == [(method, "/records")] * 2
+
+
+def test_server_error_retried(server: _Server, client: KaleidoscopeClient):
+    server.responses = [(503, {}, {}), (200, {"ok": True}, {})]
+
+    assert client._get("/records") == {"ok": True}
+    assert server.requests == [("GET", "/records")] * 2
+
+
+def test_post_server_error_not_retried(server: _Server, client: KaleidoscopeClient):
+    server.responses = [(503, {}, {}), (200, {"ok": True}, {})]
+
+    assert client._post("/records", {}) is None
+    assert server.requests == [("POST", "/records")]
+
+
+def test_post_not_retried_once_sent():
+    retry = _Retry(total=5, allowed_methods=frozenset({"GET", "PUT", "DELETE"}))
+    error = ReadTimeoutError(None, "/records", "read timed out")
+
+    with pytest.raises(ReadTimeoutError):
+        retry.increment("POST", "/records", error=error)
+    assert retry.increment("GET", "/records", error=error).total == 4
+
+
+def test_post_retried_before_sent():
+    retry = _Retry(total=5, allowed_methods=frozenset({"GET", "PUT", "DELETE"}))
+    error = ConnectTimeoutError("connect timed out")
+
+    assert retry.increment("POST", "/records", error=error).total == 4
+
+
+def test_httpx_transport_retries_responses(server: _Server):
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    server.responses = [
+        (429, {}, {"Retry-After": "0"}),
+        (503, {}, {}),
+        (200, {"ok": True}, {}),
+        (503, {}, {}),
+        (200, {"ok": True}, {}),
+    ]
+
+    client = KaleidoscopeClient(
+        "test-client-id", "test-client-secret", server.url, transport="httpx"
+    )
+    try:
+        assert client._get("/records") == {"ok": True}
+        assert client._post("/records", {}) is None
+    finally:
+        client.close()
+
+    assert server.requests == [("GET", "/records")] * 3 + [("POST", "/records")]
+
+
+def test_httpx_transport_unreachable_token_endpoint():
+    pytest.importorskip("httpx")
+    pytest.importorskip("h2")
+    # a port nothing listens on once the socket is closed
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        url = f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+    client = KaleidoscopeClient(
+        "test-client-id", "test-client-secret", url, transport="httpx"
+    )
+    try:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._get("/records")
+
+        # the background refresh survives the failure and schedules a retry
+        client._background_refresh(0)
+        assert client._refresh_timer is not None
+    finally:
+        client.close()
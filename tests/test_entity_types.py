@@ -6,12 +6,13 @@ Test Coverage:
     - EntityTypesService._create_entity_type(): Tests client injection
     - EntityTypesService._create_entity_type_list(): Tests batch client injection
     - EntityTypesService.get_types(): Tests retrieval of all entity types
-    - EntityTypesService.get_type_by_name(): Tests retrieval by name with None fallback
+    - EntityTypesService.get_type_by_name(): Tests retrieval by name with None fallback and reindexing
     - EntityTypesService.get_types_with_key_fields(): Tests filtering by key fields
     - EntityTypesService.get_type_exact_keys(): Tests exact key field matching with order independence
 
 Fixtures:
     - `entity_type`: Provides a pre-configured EntityType instance with mocked client
+    - `multi_key_entity_type`: Provides mock entity type data with several key fields
 """
 
 import pytest
@@ -36,6 +37,18 @@ def fixture_entity_type(kal_client_mock: KaleidoscopeClient) -> EntityType:
     return entity_type
 
 
+@pytest.fixture(name="multi_key_entity_type")
+def fixture_multi_key_entity_type() -> dict:
+    """Fixture that provides the first mock entity type with several key fields."""
+    entity_type_data = next(
+        (et for et in _MockData.ENTITY_TYPES if len(et["key_field_ids"]) > 1), None
+    )
+    if entity_type_data is None:
+        pytest.skip("no mock entity type has more than one key field")
+
+    return entity_type_data
+
+
 # ==================== EntityType Instance Methods ====================
 
 
@@ -56,11 +69,10 @@ def test_entity_type_get_record_ids(
     result = entity_type.get_record_ids()
 
     mock_get.assert_called_once_with(
-        f"/records/search?entity_slice_id={entity_type.id}"
+        "/records/search", {"entity_slice_id": entity_type.id}
     )
 
-    assert len(result) == len(record_ids)
-    assert all(record_ids[i] == result[i] for i in range(len(record_ids)))
+    assert result == record_ids
 
 
 # ==================== EntityTypesService Methods ====================
@@ -181,6 +193,37 @@ def test_get_type_by_name_returns_none_when_not_found(
     assert result is None
 
 
+def test_get_type_by_name_reindexes_after_refetch(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that EntityTypesService.get_type_by_name():
+    - Reuses its index for repeated lookups
+    - Sees new entity types once the get_types cache is cleared
+    """
+    entity_types_data = _MockData.ENTITY_TYPES
+    renamed = {**entity_types_data[0], "slice_name": "RenamedSlice"}
+
+    mock_get = mocker.patch.object(
+        kal_client_mock,
+        "_get",
+        side_effect=[entity_types_data, [renamed, *entity_types_data[1:]]],
+    )
+
+    service = kal_client_mock.entity_types
+    assert service.get_type_by_name(entity_types_data[1]["slice_name"]) is not None
+    assert service.get_type_by_name("RenamedSlice") is None
+    assert mock_get.call_count == 1
+
+    service.get_types.cache_clear()
+
+    result = service.get_type_by_name("RenamedSlice")
+
+    assert mock_get.call_count == 2
+    assert result is not None
+    assert result.id == renamed["id"]
+
+
 def test_get_types_with_key_fields(
     mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
 ):
@@ -209,16 +252,16 @@ def test_get_types_with_key_fields(
 
 
 def test_get_types_with_multiple_key_fields(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+    mocker: MockerFixture,
+    kal_client_mock: KaleidoscopeClient,
+    multi_key_entity_type: dict,
 ):
     """
     Test that EntityTypesService.get_types_with_key_fields():
     - Finds entity types that have ALL the specified key fields
     """
     entity_types_data = _MockData.ENTITY_TYPES
-    # Use entity type with multiple key fields
-    target_entity = next(et for et in entity_types_data if len(et["key_field_ids"]) > 1)
-    target_key_fields = target_entity["key_field_ids"]
+    target_key_fields = multi_key_entity_type["key_field_ids"]
 
     mocker.patch.object(kal_client_mock, "_get", return_value=entity_types_data)
 
@@ -270,15 +313,16 @@ def test_get_type_exact_keys_returns_none_when_not_found(
 
 
 def test_get_type_exact_keys_with_different_order(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+    mocker: MockerFixture,
+    kal_client_mock: KaleidoscopeClient,
+    multi_key_entity_type: dict,
 ):
     """
     Test that EntityTypesService.get_type_exact_keys():
     - Matches entity types regardless of key field order (using set comparison)
     """
     entity_types_data = _MockData.ENTITY_TYPES
-    # Find entity with multiple key fields
-    target_entity = next(et for et in entity_types_data if len(et["key_field_ids"]) > 1)
+    target_entity = multi_key_entity_type
     target_key_fields = target_entity["key_field_ids"]
     # Reverse the order
     reversed_key_fields = list(reversed(target_key_fields))
@@ -18,10 +18,14 @@ Test Coverage:
         - test_get_or_create_data_field_with_different_types: Validates handling of various field types
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 from pytest_mock import MockerFixture
 
 from kalpy.client import KaleidoscopeClient
-from kalpy.entity_fields import DataFieldTypeEnum, EntityField
+from kalpy.entity_fields import DataFieldTypeEnum, EntityField, EntityFieldsService
 from tests.conftest import _MockData
 
 
@@ -71,6 +75,58 @@ def test_get_key_field_by_name(
     assert result.is_key is True
 
 
+def test_get_key_fields_cache_expires(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that FieldsService.get_key_fields() and get_key_field_by_name():
+    - Share one cached fetch of the key fields
+    - Fetch again once the cached result is older than cache_ttl
+    """
+    service = EntityFieldsService(kal_client_mock, cache_ttl=60)
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=_MockData.KEY_FIELDS
+    )
+    mock_monotonic = mocker.patch(
+        "kalpy.entity_fields.time.monotonic", return_value=0
+    )
+    target_field_name = _MockData.KEY_FIELDS[0]["field_name"]
+
+    service.get_key_fields()
+    mock_monotonic.return_value = 59
+    field = service.get_key_field_by_name(target_field_name)
+    assert mock_get.call_count == 1
+    assert field is not None and field.field_name == target_field_name
+
+    mock_monotonic.return_value = 61
+    service.get_key_fields()
+    assert mock_get.call_count == 2
+
+
+def test_get_or_create_key_field_invalidates_cache(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that FieldsService.get_or_create_key_field():
+    - Discards the cached key fields, so the next read fetches them again
+    """
+    field_name = "TestKeyField"
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=_MockData.KEY_FIELDS
+    )
+    mocker.patch.object(
+        kal_client_mock,
+        "_post",
+        return_value={**_MockData.KEY_FIELDS[0], "field_name": field_name},
+    )
+
+    kal_client_mock.entity_fields.get_key_fields()
+    kal_client_mock.entity_fields.get_or_create_key_field(field_name)
+    kal_client_mock.entity_fields.get_key_fields()
+
+    assert mock_get.call_count == 2
+
+
 def test_get_key_field_by_name_returns_none_when_not_found(
     mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
 ):
@@ -97,8 +153,7 @@ def test_get_or_create_key_field(
     - If this field does not exist, it is created
     """
     field_name = "TestKeyField"
-    response_field = _MockData.KEY_FIELDS[0].copy()
-    response_field["field_name"] = field_name
+    response_field = {**_MockData.KEY_FIELDS[0], "field_name": field_name}
 
     mock_post = mocker.patch.object(
         kal_client_mock, "_post", return_value=response_field
@@ -206,9 +261,11 @@ def test_get_or_create_data_field(
     """
     field_name = "TestDataField"
     field_type = DataFieldTypeEnum.TEXT
-    response_field = _MockData.DATA_FIELDS[0].copy()
-    response_field["field_name"] = field_name
-    response_field["field_type"] = field_type.value
+    response_field = {
+        **_MockData.DATA_FIELDS[0],
+        "field_name": field_name,
+        "field_type": field_type.value,
+    }
 
     mock_post = mocker.patch.object(
         kal_client_mock, "_post", return_value=response_field
@@ -255,32 +312,167 @@ def test_get_or_create_data_field_existing(
     assert result.field_name == field_name
 
 
+@pytest.mark.parametrize(
+    "field_type",
+    [
+        DataFieldTypeEnum.TEXT,
+        DataFieldTypeEnum.NUMBER,
+        DataFieldTypeEnum.BOOLEAN,
+        DataFieldTypeEnum.DATE,
+    ],
+    ids=lambda field_type: field_type.value,
+)
 def test_get_or_create_data_field_with_different_types(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+    mocker: MockerFixture,
+    kal_client_mock: KaleidoscopeClient,
+    field_type: DataFieldTypeEnum,
 ):
     """
     Test that FieldsService.get_or_create_data_field():
     - Works correctly with different field types
     """
-    field_types = [
-        DataFieldTypeEnum.TEXT,
-        DataFieldTypeEnum.NUMBER,
-        DataFieldTypeEnum.BOOLEAN,
-        DataFieldTypeEnum.DATE,
-    ]
+    field_name = f"TestField_{field_type.value}"
+    response_field = {
+        **_MockData.DATA_FIELDS[0],
+        "field_name": field_name,
+        "field_type": field_type.value,
+    }
+
+    mocker.patch.object(kal_client_mock, "_post", return_value=response_field)
+
+    result = kal_client_mock.entity_fields.get_or_create_data_field(
+        field_name, field_type
+    )
+
+    assert isinstance(result, EntityField)
+    assert result.field_name == field_name
+    assert result.field_type == field_type
+
+
+def test_get_or_create_data_fields(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that FieldsService.get_or_create_data_fields():
+    - Fetches the existing data fields once
+    - Only makes POST requests for the fields that do not exist yet
+    - Returns the fields in the requested order
+    """
+    existing_name = _MockData.DATA_FIELDS[0]["field_name"]
+    new_name = "TestDataField"
+
+    mock_get = mocker.patch.object(
+        kal_client_mock, "_get", return_value=_MockData.DATA_FIELDS
+    )
+    mock_post = mocker.patch.object(
+        kal_client_mock,
+        "_post",
+        return_value={**_MockData.DATA_FIELDS[0], "field_name": new_name},
+    )
+
+    result = kal_client_mock.entity_fields.get_or_create_data_fields(
+        [
+            (new_name, DataFieldTypeEnum.TEXT),
+            (existing_name, DataFieldTypeEnum.TEXT),
+            (new_name, DataFieldTypeEnum.TEXT),
+        ]
+    )
+
+    mock_get.assert_called_once_with("/data_fields")
+    mock_post.assert_called_once_with(
+        "/data_fields/",
+        {"field_name": new_name, "field_type": "text", "attrs": {}},
+    )
+    assert [f.field_name for f in result] == [new_name, existing_name, new_name]
+
+
+def test_data_field_type_from_value():
+    """
+    Test that DataFieldTypeEnum.from_value():
+    - Returns the same member as calling the enum
+    - Raises ValueError for unknown values
+    """
+    for field_type in DataFieldTypeEnum:
+        assert DataFieldTypeEnum.from_value(field_type.value) is field_type
+
+    with pytest.raises(ValueError):
+        DataFieldTypeEnum.from_value("not-a-type")
+
+
+def test_get_or_create_key_fields_concurrently(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that FieldsService.get_or_create_key_fields():
+    - Creates each missing key field once, with requests sent concurrently
+    - Returns the fields in the requested order
+    """
+    names = [f"TestKeyField{i}" for i in range(6)]
+
+    def post(url: str, data: dict) -> dict:
+        return {**_MockData.KEY_FIELDS[0], "field_name": data["field_name"]}
+
+    mocker.patch.object(kal_client_mock, "_get", return_value=[])
+    mock_post = mocker.patch.object(kal_client_mock, "_post", side_effect=post)
+
+    result = kal_client_mock.entity_fields.get_or_create_key_fields(
+        names + names[:2], max_concurrency=4
+    )
+
+    assert mock_post.call_count == len(names)
+    assert [f.field_name for f in result] == names + names[:2]
+
+
+def test_get_fields_shares_fetch_without_blocking_other_urls(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that FieldsService.get_key_fields():
+    - Sends one request for concurrent callers
+    - Does not hold up a fetch of the data fields while its request is in flight
+    """
+    service = EntityFieldsService(kal_client_mock)
+    key_fields_started = threading.Event()
+    data_fields_done = threading.Event()
+
+    def get(url: str) -> list:
+        if url == "/key_fields":
+            key_fields_started.set()
+            assert data_fields_done.wait(5)
+            return _MockData.KEY_FIELDS
+        return _MockData.DATA_FIELDS
+
+    mock_get = mocker.patch.object(kal_client_mock, "_get", side_effect=get)
+
+    with ThreadPoolExecutor(max_workers=3) as ex:
+        key_fields = [ex.submit(service.get_key_fields) for _ in range(2)]
+        assert key_fields_started.wait(5)
+        assert len(service.get_data_fields()) == len(_MockData.DATA_FIELDS)
+        data_fields_done.set()
+        assert [len(f.result()) for f in key_fields] == [len(_MockData.KEY_FIELDS)] * 2
+
+    assert mock_get.call_args_list.count(mocker.call("/key_fields")) == 1
+
+
+def test_get_fields_invalidated_mid_fetch_not_cached(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that FieldsService.get_key_fields():
+    - Does not cache a result fetched while a create invalidated the cache
+    """
+    service = EntityFieldsService(kal_client_mock)
+    mocker.patch.object(kal_client_mock, "_post", return_value=_MockData.KEY_FIELDS[0])
 
-    for field_type in field_types:
-        field_name = f"TestField_{field_type.value}"
-        response_field = _MockData.DATA_FIELDS[0].copy()
-        response_field["field_name"] = field_name
-        response_field["field_type"] = field_type.value
+    def get(url: str) -> list:
+        if mock_get.call_count == 1:
+            service.get_or_create_key_field("TestKeyField")
+        return _MockData.KEY_FIELDS
 
-        mocker.patch.object(kal_client_mock, "_post", return_value=response_field)
+    mock_get = mocker.patch.object(kal_client_mock, "_get", side_effect=get)
 
-        result = kal_client_mock.entity_fields.get_or_create_data_field(
-            field_name, field_type
-        )
+    service.get_key_fields()
+    service.get_key_fields()
+    service.get_key_fields()
 
-        assert isinstance(result, EntityField)
-        assert result.field_name == field_name
-        assert result.field_type == field_type
+    assert mock_get.call_count == 2
@@ -11,7 +11,8 @@ The tests use pytest fixtures and mocking to isolate the export_data function
 from external dependencies.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+import pytest
 from pytest_mock import MockerFixture
 
 from kalpy.client import KaleidoscopeClient
@@ -20,227 +21,108 @@ from kalpy.helpers import export_data
 from tests.conftest import _MockData
 
 
-# ==================== Helper Functions ====================
-
-
-def test_export_data(mocker: MockerFixture, kal_client_mock: KaleidoscopeClient):
-    """
-    Test that export_data():
-    - Returns a list of records, each represented as a dictionary mapping field names to their values
-    - Converts field IDs to field names using client.Fields methods
-    """
-    # Create mock key fields and data fields
-    key_fields_data = _MockData.KEY_FIELDS
-    data_fields_data = _MockData.DATA_FIELDS
-
-    # Mock the Fields service methods
-    mock_get_key_fields = mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_key_fields",
-        return_value=[EntityField.model_validate(f) for f in key_fields_data],
-    )
+# ==================== Fixtures ====================
 
-    mock_get_data_fields = mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_data_fields",
-        return_value=[EntityField.model_validate(f) for f in data_fields_data],
-    )
-
-    # Create test data with field IDs as keys
-    field_id_1 = key_fields_data[0]["id"]
-    field_name_1 = key_fields_data[0]["field_name"]
-
-    field_id_2 = data_fields_data[0]["id"]
-    field_name_2 = data_fields_data[0]["field_name"]
-
-    input_data = [
-        {field_id_1: "value1", field_id_2: "value2"},
-        {field_id_1: "value3", field_id_2: "value4"},
-    ]
-
-    result = export_data(kal_client_mock, input_data)
 
-    # Verify the Fields methods were called
-    mock_get_key_fields.assert_called_once()
-    mock_get_data_fields.assert_called_once()
+@pytest.fixture(name="key_fields", scope="module")
+def fixture_key_fields() -> List[EntityField]:
+    """Fixture that provides the mock key fields as EntityField objects."""
+    return [EntityField.model_validate(f) for f in _MockData.KEY_FIELDS]
 
-    # Verify the output structure
-    assert isinstance(result, list)
-    assert len(result) == 2
 
-    # Verify field IDs were replaced with field names
-    assert field_name_1 in result[0]
-    assert field_name_2 in result[0]
-    assert result[0][field_name_1] == "value1"
-    assert result[0][field_name_2] == "value2"
+@pytest.fixture(name="data_fields", scope="module")
+def fixture_data_fields() -> List[EntityField]:
+    """Fixture that provides the mock data fields as EntityField objects."""
+    return [EntityField.model_validate(f) for f in _MockData.DATA_FIELDS]
 
-    assert field_name_1 in result[1]
-    assert field_name_2 in result[1]
-    assert result[1][field_name_1] == "value3"
-    assert result[1][field_name_2] == "value4"
 
+# ==================== Helper Functions ====================
 
-def test_export_data_with_unknown_field_id(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+# Columns of the test records: ("key", i) and ("data", i) stand for the i-th mock
+# key field and data field, any other string is a field ID that does not exist
+Column = Tuple[str, int] | str
+
+
+@pytest.mark.parametrize(
+    "records",
+    [
+        pytest.param(
+            [
+                {("key", 0): "value1", ("data", 0): "value2"},
+                {("key", 0): "value3", ("data", 0): "value4"},
+            ],
+            id="key_and_data_fields",
+        ),
+        pytest.param(
+            [{("key", 0): "known_value", "unknown-field-id-123": "unknown_value"}],
+            id="unknown_field_id",
+        ),
+        pytest.param([], id="empty_list"),
+        pytest.param(
+            [
+                {
+                    ("key", 0): "key_value_1",
+                    ("key", 1): "key_value_2",
+                    ("data", 0): "data_value_1",
+                    ("data", 1): "data_value_2",
+                }
+            ],
+            id="all_field_types",
+        ),
+        pytest.param(
+            [
+                {("key", 0): "string_value", ("data", 0): 42, ("data", 1): True},
+                {("key", 0): "another_string", ("data", 0): 3.14, ("data", 1): None},
+            ],
+            id="value_types",
+        ),
+    ],
+)
+def test_export_data(
+    mocker: MockerFixture,
+    kal_client_mock: KaleidoscopeClient,
+    key_fields: List[EntityField],
+    data_fields: List[EntityField],
+    records: List[Dict[Column, Any]],
 ):
     """
     Test that export_data():
+    - Converts field IDs to field names using client.entity_fields methods
+    - Handles records with both key fields and data fields
     - Preserves unknown field IDs (not in key_fields or data_fields) as-is
-    """
-    key_fields_data = _MockData.KEY_FIELDS[:1]
-    data_fields_data = _MockData.DATA_FIELDS[:1]
-
-    mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_key_fields",
-        return_value=[EntityField.model_validate(f) for f in key_fields_data],
-    )
-
-    mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_data_fields",
-        return_value=[EntityField.model_validate(f) for f in data_fields_data],
-    )
-
-    known_field_id = key_fields_data[0]["id"]
-    known_field_name = key_fields_data[0]["field_name"]
-    unknown_field_id = "unknown-field-id-123"
-
-    input_data = [{known_field_id: "known_value", unknown_field_id: "unknown_value"}]
-
-    result = export_data(kal_client_mock, input_data)
-
-    assert len(result) == 1
-    # Known field ID should be converted to field name
-    assert known_field_name in result[0]
-    assert result[0][known_field_name] == "known_value"
-    # Unknown field ID should be preserved as-is
-    assert unknown_field_id in result[0]
-    assert result[0][unknown_field_id] == "unknown_value"
-
-
-def test_export_data_empty_list(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
-):
-    """
-    Test that export_data():
+    - Preserves the values and their types (not just strings)
     - Returns an empty list when given an empty list
     """
-    key_fields_data = _MockData.KEY_FIELDS
-    data_fields_data = _MockData.DATA_FIELDS
-
-    mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_key_fields",
-        return_value=[EntityField.model_validate(f) for f in key_fields_data],
+    mock_get_key_fields = mocker.patch.object(
+        kal_client_mock.entity_fields, "get_key_fields", return_value=key_fields
     )
-
-    mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_data_fields",
-        return_value=[EntityField.model_validate(f) for f in data_fields_data],
+    mock_get_data_fields = mocker.patch.object(
+        kal_client_mock.entity_fields, "get_data_fields", return_value=data_fields
     )
 
-    input_data: List[Dict[str, Any]] = []
-
-    result = export_data(kal_client_mock, input_data)
-
-    assert isinstance(result, list)
-    assert len(result) == 0
-
-
-def test_export_data_with_all_field_types(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
-):
-    """
-    Test that export_data():
-    - Correctly handles records with both key fields and data fields
-    """
-    key_fields_data = _MockData.KEY_FIELDS
-    data_fields_data = _MockData.DATA_FIELDS
+    fields = {"key": key_fields, "data": data_fields}
 
-    mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_key_fields",
-        return_value=[EntityField.model_validate(f) for f in key_fields_data],
-    )
+    def resolve(column: Column, attr: str) -> str:
+        if isinstance(column, str):
+            return column
+        kind, index = column
+        return getattr(fields[kind][index], attr)
 
-    mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_data_fields",
-        return_value=[EntityField.model_validate(f) for f in data_fields_data],
-    )
-
-    # Create input with multiple key and data fields
     input_data = [
-        {
-            key_fields_data[0]["id"]: "key_value_1",
-            key_fields_data[1]["id"]: "key_value_2",
-            data_fields_data[0]["id"]: "data_value_1",
-            data_fields_data[1]["id"]: "data_value_2",
-        }
+        {resolve(column, "id"): value for column, value in record.items()}
+        for record in records
     ]
-
-    result = export_data(kal_client_mock, input_data)
-
-    assert len(result) == 1
-    # All field IDs should be replaced with field names
-    assert key_fields_data[0]["field_name"] in result[0]
-    assert key_fields_data[1]["field_name"] in result[0]
-    assert data_fields_data[0]["field_name"] in result[0]
-    assert data_fields_data[1]["field_name"] in result[0]
-    # Values should be preserved
-    assert result[0][key_fields_data[0]["field_name"]] == "key_value_1"
-    assert result[0][key_fields_data[1]["field_name"]] == "key_value_2"
-    assert result[0][data_fields_data[0]["field_name"]] == "data_value_1"
-    assert result[0][data_fields_data[1]["field_name"]] == "data_value_2"
-
-
-def test_export_data_preserves_value_types(
-    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
-):
-    """
-    Test that export_data():
-    - Preserves the types of values (not just strings)
-    """
-    key_fields_data = _MockData.KEY_FIELDS[:1]
-    data_fields_data = _MockData.DATA_FIELDS[:2]
-
-    mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_key_fields",
-        return_value=[EntityField.model_validate(f) for f in key_fields_data],
-    )
-
-    mocker.patch.object(
-        kal_client_mock.entity_fields,
-        "get_data_fields",
-        return_value=[EntityField.model_validate(f) for f in data_fields_data],
-    )
-
-    field_id_1 = key_fields_data[0]["id"]
-    field_id_2 = data_fields_data[0]["id"]
-    field_id_3 = data_fields_data[1]["id"]
-
-    # Test with different value types
-    input_data = [
-        {field_id_1: "string_value", field_id_2: 42, field_id_3: True},
-        {field_id_1: "another_string", field_id_2: 3.14, field_id_3: None},
+    expected = [
+        {resolve(column, "field_name"): value for column, value in record.items()}
+        for record in records
     ]
 
     result = export_data(kal_client_mock, input_data)
 
-    field_name_1 = key_fields_data[0]["field_name"]
-    field_name_2 = data_fields_data[0]["field_name"]
-    field_name_3 = data_fields_data[1]["field_name"]
-
-    # Verify types are preserved
-    assert result[0][field_name_1] == "string_value"
-    assert result[0][field_name_2] == 42
-    assert isinstance(result[0][field_name_2], int)
-    assert result[0][field_name_3] is True
-
-    assert result[1][field_name_1] == "another_string"
-    assert result[1][field_name_2] == 3.14
-    assert isinstance(result[1][field_name_2], float)
-    assert result[1][field_name_3] is None
+    mock_get_key_fields.assert_called_once()
+    mock_get_data_fields.assert_called_once()
+    assert result == expected
+    # == treats 42 and 42.0 or True and 1 alike, so compare the value types too
+    assert [[type(v) for v in r.values()] for r in result] == [
+        [type(v) for v in r.values()] for r in expected
+    ]
@@ -75,8 +75,7 @@ def test_get_programs_by_ids(
 
     assert isinstance(result, list)
     assert all(isinstance(p, Program) for p in result)
-    assert len(result) == 2
-    assert all(p.id in target_ids for p in result)
+    assert [p.id for p in result] == target_ids
 
 
 def test_get_programs_by_ids_single_id(
@@ -131,8 +130,7 @@ def test_get_programs_by_ids_all_programs(
 
     result = kal_client_mock.programs.get_programs_by_ids(all_ids)
 
-    assert len(result) == len(programs_data)
-    assert all(p.id in all_ids for p in result)
+    assert [p.id for p in result] == all_ids
 
 
 def test_get_programs_by_ids_partial_matches(
@@ -149,9 +147,7 @@ def test_get_programs_by_ids_partial_matches(
 
     result = kal_client_mock.programs.get_programs_by_ids(mixed_ids)
 
-    assert len(result) == 2
-    assert result[0].id == programs_data[0]["id"]
-    assert result[1].id == programs_data[2]["id"]
+    assert [p.id for p in result] == [programs_data[0]["id"], programs_data[2]["id"]]
 
 
 def test_get_programs_by_ids_empty_list(
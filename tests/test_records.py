@@ -11,7 +11,7 @@ The tests use mocked KaleidoscopeClient instances to verify API calls
 without making actual HTTP requests.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from io import BytesIO
 from uuid import uuid4
 
@@ -89,7 +89,7 @@ def test_record_get_value_content_basic(record: Record):
     Test that Record.get_value_content():
     - Returns the most recent value content for a field
     """
-    field_id = list(record.record_values.keys())[0]
+    field_id = next(iter(record.record_values))
 
     result = record.get_value_content(field_id)
 
@@ -101,7 +101,7 @@ def test_record_get_value_content_filtered_by_activity(record: Record):
     Test that Record.get_value_content():
     - Can be filtered by activity_id
     """
-    field_id = list(record.record_values.keys())[0]
+    field_id = next(iter(record.record_values))
     activity_id = record.record_values[field_id][0].operation_id
 
     record.get_value_content(field_id, activity_id=activity_id)
@@ -110,21 +110,150 @@ def test_record_get_value_content_filtered_by_activity(record: Record):
     assert record.record_values[field_id][0].content
 
 
+def test_record_get_value_content_untimed_value(record: Record):
+    """
+    Test that Record.get_value_content():
+    - Ranks a value without created_at below timezone-aware values
+    """
+    record.record_values = {
+        "field-1": [
+            RecordValue(id="1", content="untimed", record_id=record.id),
+            RecordValue(
+                id="2",
+                content="timed",
+                created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+                record_id=record.id,
+            ),
+        ]
+    }
+
+    assert record.get_value_content("field-1") == "timed"
+
+
 def test_record_get_activity_data(record: Record):
     """
     Test that Record.get_activity_data():
     - Returns a dict mapping field IDs to values for the given activity
     """
-    activity_id = str(list(record.record_values.values())[0][0].operation_id)
+    activity_id = str(next(iter(record.record_values.values()))[0].operation_id)
 
     result = record.get_activity_data(activity_id)
 
     assert isinstance(result, dict)
-    assert all(
-        list(result)[x] in list(record.record_values) for x in range(len(result))
+    assert result.keys() <= record.record_values.keys()
+
+
+def test_record_get_activity_data_latest_values(record: Record):
+    """
+    Test that Record.get_activity_data():
+    - Returns the most recent value of the activity for each field
+    - Includes key values and skips values of other activities and sub-records
+    """
+
+    def value(content, created_at, operation_id=None, record_id=record.id):
+        return RecordValue(
+            id=str(uuid4()),
+            content=content,
+            created_at=created_at,
+            operation_id=operation_id,
+            record_id=record_id,
+        )
+
+    record.record_values = {
+        "field-1": [
+            value("old", datetime(2025, 1, 1), "activity-1"),
+            value("new", datetime(2025, 1, 3), "activity-1"),
+            value("other activity", datetime(2025, 1, 5), "activity-2"),
+            value("sub record", datetime(2025, 1, 6), "activity-1", "sub-record"),
+        ],
+        "field-2": [value("key value", datetime(2025, 1, 1), record_id=None)],
+        "field-3": [value("other activity", datetime(2025, 1, 1), "activity-2")],
+    }
+
+    result = record.get_activity_data("activity-1")
+
+    assert result == {"field-1": "new", "field-2": "key value"}
+    assert record.get_value_content("field-1", "activity-1") == "new"
+    assert (
+        record.get_value_content(
+            "field-1", include_sub_record_values=True, sub_record_id="sub-record"
+        )
+        == "sub record"
     )
 
 
+def test_record_get_value_content_long_value_list(record: Record):
+    """
+    Test that Record.get_value_content():
+    - Finds activity, key and sub-record values in a long value list
+    - Sees values appended to the list after an earlier lookup
+    """
+    values = [
+        RecordValue(
+            id=str(i),
+            content=i,
+            created_at=datetime(2025, 1, 1, minute=i % 60),
+            operation_id=f"activity-{i % 10}",
+            record_id=record.id if i % 7 else "sub-record",
+        )
+        for i in range(100)
+    ]
+    values.append(RecordValue(id="key", content="key value", record_id=None))
+    record.record_values = {"field-1": values}
+
+    assert record.get_value_content("field-1", "activity-3") == 53
+    assert record.get_value_content("field-1", "missing-activity") == "key value"
+    assert (
+        record.get_value_content(
+            "field-1", include_sub_record_values=True, sub_record_id="sub-record"
+        )
+        == 56
+    )
+
+    values.append(
+        RecordValue(
+            id="new",
+            content="new",
+            created_at=datetime(2025, 1, 2),
+            operation_id="activity-3",
+            record_id=record.id,
+        )
+    )
+
+    assert record.get_value_content("field-1", "activity-3") == "new"
+
+
+def test_record_get_value_content_memoizes_long_value_lists(
+    mocker: MockerFixture, record: Record
+):
+    """
+    Test that Record.get_value_content():
+    - Scans a long value list once for repeated identical lookups
+    - Scans again once the field's value list is replaced
+    """
+    values = [
+        RecordValue(
+            id=str(i),
+            content=i,
+            created_at=datetime(2025, 1, 1, minute=i % 60),
+            operation_id=f"activity-{i % 10}",
+            record_id=record.id,
+        )
+        for i in range(100)
+    ]
+    record.record_values = {"field-1": values}
+    scan = mocker.spy(record, "_scan_latest")
+
+    assert record.get_value_content("field-1", "activity-3") == 53
+    assert record.get_value_content("field-1", "activity-3") == 53
+    assert scan.call_count == 1
+
+    record.record_values = {"field-1": list(reversed(values))}
+
+    assert record.get_value_content("field-1", "activity-3") == 53
+    assert scan.call_count == 2
+
+
 def test_record_update_field(
     mocker: MockerFixture, kal_client_mock: KaleidoscopeClient, record: Record
 ):
@@ -140,8 +269,7 @@ def test_record_update_field(
     value = "new value"
 
     # updated field data
-    response = drug_1_data
-    response["content"] = value
+    response = {**drug_1_data, "content": value}
 
     mock_post = mocker.patch.object(
         kal_client_mock, "_post", return_value={"resource": response}
@@ -178,14 +306,34 @@ def test_record_update_field_file(
 
     result = record.update_field_file(field_id, file_name, file_data, file_type)
 
-    mock_post_file.assert_called_once()
-    call_args: tuple = mock_post_file.call_args
-    assert call_args[0][0] == f"/records/{record.id}/values/file"
-    assert call_args[0][1][0] == file_name
-    assert call_args[0][1][2] == file_type
+    mock_post_file.assert_called_once_with(
+        f"/records/{record.id}/values/file",
+        (file_name, file_data, file_type),
+        {"field_id": field_id},
+    )
     assert isinstance(result, RecordValue)
 
 
+def test_record_get_values(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient, record: Record
+):
+    """
+    Test that Record.get_values():
+    - Makes the GET request to the proper endpoint
+    - Returns the values as RecordValue objects with parsed timestamps
+    """
+    values_data = _MockData.RECORD_VALUES_DRUG_1
+
+    mock_get = mocker.patch.object(kal_client_mock, "_get", return_value=values_data)
+
+    result = record.get_values()
+
+    mock_get.assert_called_once_with(f"/records/{record.id}/values")
+    assert [value.id for value in result] == [value["id"] for value in values_data]
+    assert all(isinstance(value, RecordValue) for value in result)
+    assert all(isinstance(value.created_at, datetime) for value in result)
+
+
 # ==================== RecordsService Methods ====================
 
 
@@ -216,6 +364,43 @@ def test_create_record_list(kal_client_mock: KaleidoscopeClient):
     assert all(r._client is kal_client_mock for r in result)
 
 
+def test_create_record_list_unvalidated(kal_client_mock: KaleidoscopeClient):
+    """
+    Test that RecordsService._create_record_list():
+    - Builds the records without validation when validate is False
+    - Still parses the record timestamps into datetimes
+    - Client is injected into all new records
+    """
+    records_data = _MockData.RECORDS
+
+    result = kal_client_mock.records._create_record_list(records_data, validate=False)
+
+    assert [r.id for r in result] == [rec["id"] for rec in records_data]
+    assert all(isinstance(r.created_at, datetime) for r in result)
+    assert all(r._client is kal_client_mock for r in result)
+
+
+def test_create_record_trusted_matches_validated(kal_client_mock: KaleidoscopeClient):
+    """
+    Test that RecordsService._create_record(validate=False):
+    - Builds the same record without validation as with it
+    - Parses the record and value timestamps into datetimes
+    - Sets the client on the nested record values
+    """
+    record_data = _MockData.RECORDS[0]
+
+    trusted = kal_client_mock.records._create_record(record_data, validate=False)
+    validated = kal_client_mock.records._create_record(record_data)
+
+    assert trusted.model_dump() == validated.model_dump()
+    assert isinstance(trusted.created_at, datetime)
+    for values in trusted.record_values.values():
+        for value in values:
+            assert isinstance(value, RecordValue)
+            assert value.created_at is None or isinstance(value.created_at, datetime)
+            assert value._client is kal_client_mock
+
+
 def test_get_record_by_id(mocker: MockerFixture, kal_client_mock: KaleidoscopeClient):
     """
     Test that RecordsService.get_record_by_id():
@@ -248,41 +433,91 @@ def test_get_record_by_id_returns_none_when_not_found(
     assert result is None
 
 
-def test_get_records_by_ids(mocker: MockerFixture, kal_client_mock: KaleidoscopeClient):
+def test_get_record_by_id_logs_record_id(
+    caplog: pytest.LogCaptureFixture,
+    mocker: MockerFixture,
+    kal_client_mock: KaleidoscopeClient,
+):
+    """
+    Test that RecordsService.get_record_by_id():
+    - Returns None and logs the requested record id when the request fails
+    """
+    mocker.patch.object(kal_client_mock, "_get", side_effect=RuntimeError("boom"))
+
+    result = kal_client_mock.records.get_record_by_id("record-1")
+
+    assert result is None
+    assert "Error fetching record record-1: boom" in caplog.text
+
+
+@pytest.mark.parametrize(
+    "num_ids, kwargs, batches",
+    [
+        pytest.param(2, {}, [slice(0, 2)], id="default_batch_size"),
+        pytest.param(
+            300,
+            {"batch_size": 100},
+            [slice(0, 100), slice(100, 200), slice(200, 300)],
+            id="batched",
+        ),
+    ],
+)
+def test_get_records_by_ids(
+    mocker: MockerFixture,
+    kal_client_mock: KaleidoscopeClient,
+    num_ids: int,
+    kwargs: dict,
+    batches: list[slice],
+):
     """
     Test that RecordsService.get_records_by_ids():
-    - Makes the GET request to the proper endpoint
-    - Returns all records for the given IDs
+    - Makes one GET request to the proper endpoint per batch of IDs
+    - Returns the records of every batch
     """
     records_data = _MockData.RECORDS[:2]
-    record_ids = [rec["id"] for rec in records_data]
+    record_ids = [f"rec-{i}" for i in range(num_ids)]
 
     mock_get = mocker.patch.object(kal_client_mock, "_get", return_value=records_data)
 
-    result = kal_client_mock.records.get_records_by_ids(record_ids)
+    result = kal_client_mock.records.get_records_by_ids(record_ids, **kwargs)
 
-    mock_get.assert_called_once()
-    assert isinstance(result, list)
+    # batches may be requested concurrently, so accept them in any order
+    assert mock_get.call_count == len(batches)
+    mock_get.assert_has_calls(
+        [
+            mocker.call("/records", {"record_ids": ",".join(record_ids[batch])})
+            for batch in batches
+        ],
+        any_order=True,
+    )
     assert all(isinstance(r, Record) for r in result)
-    assert len(result) == len(records_data)
+    assert len(result) == len(records_data) * len(batches)
 
 
-def test_get_records_by_ids_batching(
+def test_get_records_by_ids_concurrent_preserves_batch_order(
     mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
 ):
     """
     Test that RecordsService.get_records_by_ids():
-    - Makes multiple GET requests when batch size is exceeded
+    - Requests every batch when batches are fetched concurrently
+    - Returns records in batch order regardless of completion order
     """
     records_data = _MockData.RECORDS
-    record_ids = [f"rec-{i}" for i in range(300)]  # More than default batch size
+    record_ids = [rec["id"] for rec in records_data]
+    responses = {rec["id"]: [rec] for rec in records_data}
 
-    mock_get = mocker.patch.object(kal_client_mock, "_get", return_value=records_data)
+    mock_get = mocker.patch.object(
+        kal_client_mock,
+        "_get",
+        side_effect=lambda url, params: responses[params["record_ids"]],
+    )
 
-    kal_client_mock.records.get_records_by_ids(record_ids, batch_size=100)
+    result = kal_client_mock.records.get_records_by_ids(
+        record_ids, batch_size=1, max_concurrency=3
+    )
 
-    # Should make 3 calls for 300 IDs with batch_size=100
-    assert mock_get.call_count == 3
+    assert mock_get.call_count == len(record_ids)
+    assert [record.id for record in result] == record_ids
 
 
 def test_get_record_by_key_values(
@@ -326,6 +561,24 @@ def test_get_or_create_record(
     assert record_data["id"] == result.id
 
 
+def test_empty_lookups_skip_requests(
+    mocker: MockerFixture, kal_client_mock: KaleidoscopeClient
+):
+    """
+    Test that RecordsService lookups with empty input:
+    - Return an empty result without making a request
+    """
+    mock_get = mocker.patch.object(kal_client_mock, "_get")
+    mock_post = mocker.patch.object(kal_client_mock, "_post")
+
+    assert kal_client_mock.records.get_records_by_ids([]) == []
+    assert kal_client_mock.records.get_record_by_key_values({}) is None
+    assert kal_client_mock.records.get_or_create_record({}) is None
+
+    mock_get.assert_not_called()
+    mock_post.assert_not_called()
+
+
 def test_search_records(mocker: MockerFixture, kal_client_mock: KaleidoscopeClient):
     """
     Test that RecordsService.search_records():
@@ -361,9 +614,9 @@ def test_create_record_value_file(
     response = {
         "resource": {
             "content": file_data,
-            "created_at": datetime.now().isoformat(),
+            "created_at": "2024-01-01T00:00:00",
             "created_by": "9d95f7a6-79ec-4cf3-9b99-eec59149a0f5",
-            "id": str(uuid4()),
+            "id": "00000000-0000-0000-0000-000000000001",
             "import_id": None,
             "field_id": "4feab06e-0a8d-407e-afd8-a54e0ca93e5c",
             "field_type": "number",